@@ -17,6 +17,15 @@ load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+
+def _fallback_screenplay(sections: list) -> dict:
+    """Hardcoded visuals used when every model fails; marked so callers don't cache it."""
+    return {
+        "mood": "Peaceful",
+        "scenes": {k: "Abstract golden particles slow motion" for k in sections},
+        "fallback": True
+    }
+
 class DirectorAgent:
     """
     The Director Agent converts a script into a Visual Screenplay.
@@ -97,7 +106,7 @@ class DirectorAgent:
             
         except Exception as e:
             logging.error(f"❌ Director: Google AI Studio failed: {e}")
-            return {"mood": "Peaceful", "scenes": {k: "Abstract golden particles slow motion" for k in sections}}
+            return _fallback_screenplay(sections)
 
     def _get_best_free_models(self) -> list:
         """Discovers best free models on OpenRouter."""
@@ -228,7 +237,4 @@ class DirectorAgent:
         
         # Ultimate fallback visuals
         logging.error("❌ All Director models/keys/fallbacks failed. Using hardcoded visuals.")
-        return {
-            "mood": "Peaceful",
-            "scenes": {k: "Abstract golden particles slow motion" for k in sections}
-        }
+        return _fallback_screenplay(sections)
@@ -2,7 +2,9 @@ import os
 import json
 import logging
 import random
+from bisect import bisect_right
 from datetime import datetime
+from itertools import accumulate
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
@@ -80,11 +82,10 @@ class YouTubeUploader:
             else:
                 return ["horoscope", "astrology", "zodiac", "shorts"]
         
-        sanitized = []
-        total_chars = 0
         MAX_TAGS_COUNT = 30  # Safety limit for number of tags
         MAX_TOTAL_CHARS = 400 # Safety buffer (limit is 500)
         
+        sanitized = []
         seen = set()
         
         for tag in tags:
@@ -110,16 +111,14 @@ class YouTubeUploader:
                 continue
             seen.add(t_lower)
             
-            # Check limits
-            # YouTube counts length of tags + separators. We use a safe buffer.
-            if total_chars + len(t) + 1 > MAX_TOTAL_CHARS:
-                break
-            
+            sanitized.append(t)
             if len(sanitized) >= MAX_TAGS_COUNT:
                 break
-                
-            sanitized.append(t)
-            total_chars += len(t) + 1
+        
+        # Check limits in one pass: YouTube counts length of tags + separators.
+        # Running totals are monotonic, so the cutoff is a binary search.
+        cumulative = list(accumulate(len(t) + 1 for t in sanitized))
+        sanitized = sanitized[:bisect_right(cumulative, MAX_TOTAL_CHARS)]
         
         # Ensure we have at least defaults if everything was filtered
         return sanitized if sanitized else ["horoscope", "astrology", "zodiac", "shorts"]
@@ -282,8 +281,19 @@ Mercury Retrograde updates, Full Moon rituals, and New Moon intentions.
             "categoryId": "24"  # Entertainment
         }
 
-    def upload_video(self, file_path: str, metadata: dict, privacy_status: str = "public", publish_at: datetime = None):
-        """Uploads the video. Supports scheduled publishing."""
+    def prepare_media(self, file_path: str):
+        """
+        Upload preflight: stats the file and builds the chunked, resumable media body.
+        Returns None if the file is missing (upload_video reports it).
+        """
+        if not os.path.exists(file_path):
+            return None
+        size_mb = os.path.getsize(file_path) / (1024 * 1024)
+        self.logger.info(f"📦 Prepared {file_path} for upload ({size_mb:.1f} MB)")
+        return MediaFileUpload(file_path, chunksize=1024*1024, resumable=True)
+
+    def upload_video(self, file_path: str, metadata: dict, privacy_status: str = "public", publish_at: datetime = None, media=None):
+        """Uploads the video. Supports scheduled publishing. Reuses a prepare_media() body if given."""
         if not self.service:
             self.logger.error("❌ Cannot upload: Not Authenticated.")
             return False
@@ -328,19 +338,24 @@ Mercury Retrograde updates, Full Moon rituals, and New Moon intentions.
         }
 
         try:
-            media = MediaFileUpload(file_path, chunksize=1024*1024, resumable=True)
+            if media is None:
+                media = self.prepare_media(file_path)
             request = self.service.videos().insert(
                 part="snippet,status",
                 body=body,
                 media_body=media
             )
             
+            # Log progress only every 10% to keep stdout quiet between chunks
             response = None
+            last_logged = 0
             while response is None:
                 status, response = request.next_chunk()
                 if status:
                     progress = int(status.progress() * 100)
-                    print(f"      📤 Uploading... {progress}%")
+                    if progress - last_logged >= 10:
+                        self.logger.info("📤 Uploading... %d%%", progress)
+                        last_logged = progress
             
             video_id = response.get("id")
             self.logger.info(f"✅ Upload Complete! Video ID: {video_id}")
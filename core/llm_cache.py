@@ -0,0 +1,42 @@
+"""
+LLM Cache - Disk-backed memo for deterministic LLM responses (e.g. viral metadata,
+Director screenplays). Each kind of response gets its own file prefix.
+Entries expire after CACHE_TTL_SECONDS so daily content never goes stale.
+"""
+import os
+import json
+import time
+import logging
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ai_us_astro")
+CACHE_TTL_SECONDS = 12 * 60 * 60  # 12 hours
+
+
+def _cache_path(key: str, prefix: str) -> str:
+    return os.path.join(CACHE_DIR, f"{prefix}_{key}.json")
+
+
+def get(key: str, prefix: str = "meta"):
+    """Returns the cached dict for key, or None if missing, expired or unreadable."""
+    path = _cache_path(key, prefix)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            value = json.load(f)
+        return value if isinstance(value, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def set(key: str, value: dict, prefix: str = "meta"):
+    """Stores value under key. Failures are logged and ignored (cache is best-effort)."""
+    path = _cache_path(key, prefix)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logging.warning(f"⚠️ LLM cache write failed: {e}")
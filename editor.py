@@ -1,15 +1,30 @@
 import os
+import io
+import base64
+import hashlib
+import subprocess
 import logging
 import json
 import asyncio
-import nest_asyncio
+import time
+import shutil
+import threading
+import uuid
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from playwright.async_api import async_playwright
-from moviepy.editor import ImageSequenceClip, AudioFileClip, CompositeAudioClip, vfx, CompositeVideoClip
+from moviepy.editor import VideoClip, VideoFileClip, AudioFileClip, CompositeAudioClip
+from moviepy.audio.AudioClip import AudioArrayClip
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
-# Allow nested asyncio loops (required for Playwright in some envs)
-nest_asyncio.apply()
+# Try to import numexpr (optional: fused, multithreaded array expressions)
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -177,10 +192,254 @@ COLOR_STYLES = {
     },
 }
 
+# Intermediate frame quality (frames are re-encoded by x264 anyway, but low-res
+# captures get upscaled 1.5x on encode, which magnifies blocking below ~85)
+JPEG_QUALITY = 85
+
+# Intermediate frame codec: "jpeg" (default) or "webp". Both are lossy and far cheaper
+# for Chromium to encode than PNG; WebP is smaller per frame on some builds.
+FRAME_FORMAT = os.getenv("EDITOR_FRAME_FORMAT", "jpeg").lower()
+if FRAME_FORMAT not in ("jpeg", "webp"):
+    FRAME_FORMAT = "jpeg"
+
+# Size cap for the on-disk frame cache (least recently used renders are evicted)
+FRAME_CACHE_MAX_MB = int(os.getenv("EDITOR_FRAME_CACHE_MB", "1024"))
+
+# Default cosmic purple theme (no sign or theme match)
+DEFAULT_STYLE = {
+    "grad": ("#0a0515", "#140a2a", "#9c27b0"),
+    "glow": "#ce93d8",
+    "element": "neutral"
+}
+
+# Image folders are searched per period type
+PERIOD_TYPES = ("Daily", "Monthly", "Yearly")
+
 # New cosmic animation styles
 COSMIC_ANIM_STYLES = ['cosmic', 'stellar', 'nebula', 'constellation', 'aurora']
 
 
+@lru_cache(maxsize=256)
+def _get_sign_key(sign_name: str) -> str:
+    """Extract sign key from name like 'Aries' or 'Aries (fire)'."""
+    sign_key = sign_name.lower().split()[0].split("(")[0].strip()
+    return sign_key
+
+
+@lru_cache(maxsize=128)
+def _find_sign_image(sign_key: str, period_type: str = "Daily") -> str:
+    """
+    Finds the zodiac image for a sign key. Memoized: the asset folders are
+    static for the life of the process, so each (sign, period) is scanned once.
+    """
+    # 1. Direct Lookup (Most robust)
+    # Try finding exactly "{sign}.png" in the main photos folder
+    direct_path = os.path.join("assets", "12_photos", f"{sign_key}.png")
+    if os.path.exists(direct_path):
+        return os.path.abspath(direct_path)
+
+    # 2. Folder Search (Fallback)
+    folders = ["12_photos"]
+    if period_type == "Monthly": folders.insert(0, "monthly_12_photos")
+    elif period_type == "Yearly": folders.insert(0, "yearly_12_photos")
+    
+    # Translate using map if available
+    mapped_key = SIGN_IMAGE_MAP.get(sign_key, sign_key)
+    
+    search_keys = [mapped_key, sign_key]
+    search_keys = list(dict.fromkeys(filter(None, search_keys)))
+    
+    for folder in folders:
+        folder_path = os.path.join("assets", folder)
+        if not os.path.exists(folder_path): continue
+        
+        try:
+            files = os.listdir(folder_path)
+            for f in files:
+                fname_lower = f.lower()
+                for key in search_keys:
+                    if key and key in fname_lower:
+                         return os.path.abspath(os.path.join(folder_path, f))
+        except Exception as e:
+            logging.warning(f"Error scanning folder {folder}: {e}")
+            
+    return None
+
+
+def _resolve_style(sign_key: str, theme_override: str = None) -> dict:
+    """Style precedence: COLOR_THEME > SIGN_STYLES > default cosmic purple."""
+    if theme_override and theme_override in COLOR_STYLES:
+        return COLOR_STYLES[theme_override]
+    return SIGN_STYLES.get(sign_key) or DEFAULT_STYLE
+
+
+@lru_cache(maxsize=64)
+def _image_to_b64_cached(image_path: str) -> str:
+    """Encodes an image file to a data URI. Memoized per path; errors are not cached."""
+    with open(image_path, "rb") as img_file:
+        b64_string = base64.b64encode(img_file.read()).decode('utf-8')
+    # Determine mime type (assume png for simplicity or detect)
+    mime_type = "image/png"
+    if image_path.lower().endswith(".jpg") or image_path.lower().endswith(".jpeg"):
+        mime_type = "image/jpeg"
+    elif image_path.lower().endswith(".webp"):
+        mime_type = "image/webp"
+    return f"data:{mime_type};base64,{b64_string}"
+
+
+def _hex_to_rgb(color: str) -> np.ndarray:
+    color = color.lstrip("#")
+    return np.array([int(color[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.float32)
+
+
+@lru_cache(maxsize=32)
+def _build_backdrop(glow: str, width: int = 270, height: int = 480) -> np.ndarray:
+    """
+    Static element glow (radial falloff at 50%/30%, 15% opacity over black) as an
+    RGB uint8 array. Mirrors the CSS radial-gradient it replaces: a farthest-corner
+    ellipse, fully transparent at 50% of its radius.
+    """
+    # Separable axes broadcast to the full grid only inside the blend
+    cx, cy = width * 0.5, height * 0.3
+    rx, ry = (width - cx) * np.sqrt(2), (height - cy) * np.sqrt(2)
+    dx = ((np.arange(width, dtype=np.float32) - cx) / rx)[None, :]
+    dy = ((np.arange(height, dtype=np.float32) - cy) / ry)[:, None]
+    if NUMEXPR_AVAILABLE:
+        # One fused pass over the grid instead of a temporary per operator
+        alpha = numexpr.evaluate("0.15 * where(t < 0.5, 1 - t / 0.5, 0)",
+                                 local_dict={"t": numexpr.evaluate("sqrt(dx**2 + dy**2)")})
+    else:
+        alpha = np.clip(1.0 - np.hypot(dx, dy) / 0.5, 0.0, 1.0) * 0.15
+    return (_hex_to_rgb(glow) * alpha[:, :, None]).round().astype(np.uint8)
+
+
+@lru_cache(maxsize=32)
+def _backdrop_data_uri(glow: str) -> str:
+    """PNG data URI of the backdrop, encoded once per glow colour (CSS stretches it to full size)."""
+    out = io.BytesIO()
+    Image.fromarray(_build_backdrop(glow)).save(out, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(out.getvalue()).decode("ascii")
+
+
+def _active_word_by_frame(subtitle_data: list, total_frames: int, fps: int = 30) -> np.ndarray:
+    """
+    Index of the karaoke word active at each frame (-1 where none is), i.e. the
+    first sub with start <= t < end, via one searchsorted over the (monotonic) word ends.
+    """
+    starts = np.asarray([sub['start'] for sub in subtitle_data], dtype=np.float64)
+    ends = np.asarray([sub.get('end', sub['start'] + sub.get('duration', 0.5)) for sub in subtitle_data], dtype=np.float64)
+    times = np.arange(total_frames) / fps
+    idx = np.searchsorted(ends, times, side='right')
+    in_range = idx < len(ends)
+    active = np.full(total_frames, -1, dtype=np.int64)
+    hit = in_range.copy()
+    hit[in_range] = starts[idx[in_range]] <= times[in_range]
+    active[hit] = idx[hit]
+    return active
+
+
+def _ffmpeg_binary() -> str:
+    """The ffmpeg executable MoviePy is configured with (imageio-ffmpeg's by default)."""
+    from moviepy.config import get_setting
+    return get_setting("FFMPEG_BINARY")
+
+
+# Final videos are capped at this length (Shorts limit)
+MAX_DURATION = 59.0
+
+# Background music level under the narration (near-silent, based on feedback)
+MUSIC_VOLUME = 0.02
+MUSIC_FPS = 44100
+
+# Mood tags recognised in music filenames (e.g. "peaceful_ambient.mp3")
+MUSIC_MOOD_TAGS = ("peaceful", "energetic", "mysterious", "ambient", "upbeat")
+
+
+# Headless Chromium flags: nothing a local, self-contained scene page needs is lost
+CHROMIUM_ARGS = (
+    "--no-sandbox", "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",  # small /dev/shm in containers/CI crashes the renderer
+    "--disable-extensions", "--mute-audio", "--hide-scrollbars",
+    "--no-first-run", "--no-default-browser-check",
+    # Concurrent scene pages are all "background" tabs: keep their timers and rAF at full rate
+    "--disable-background-timer-throttling", "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    # Thousands of CDP messages per scene
+    "--disable-ipc-flooding-protection",
+)
+
+# Seconds to wait for one HeadlessExperimental.beginFrame before giving up on it
+BEGIN_FRAME_TIMEOUT = 10
+
+# DRM render node used by the VAAPI encoder
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+# H.264 encoders in order of preference: GPU/fixed-function blocks first, x264 last
+HW_ENCODERS = {
+    "h264_nvenc": {"preset": "p4", "params": ["-tune", "ll", "-rc", "vbr", "-cq", "23", "-pix_fmt", "yuv420p"]},
+    "h264_qsv": {"preset": "veryfast", "params": ["-global_quality", "23", "-pix_fmt", "nv12"]},
+    "h264_videotoolbox": {"preset": "medium", "params": ["-q:v", "65", "-pix_fmt", "yuv420p"]},
+    # VAAPI (Intel/AMD on Linux): frames are uploaded to the GPU at the end of the filter chain
+    "h264_vaapi": {"preset": None, "params": ["-qp", "23"], "init": ["-vaapi_device", VAAPI_DEVICE],
+                   "filters": ["format=nv12", "hwupload"]},
+}
+
+# x264 at CRF 23 / veryfast: same perceived quality as medium for 59s Shorts, ~2x faster
+X264_FALLBACK = {"codec": "libx264", "preset": "veryfast", "params": ["-crf", "23", "-pix_fmt", "yuv420p"]}
+
+
+def _encoder_args(encoder: dict, video_filters: list = None) -> list:
+    """
+    ffmpeg output args for an encoder entry (codec, threads, preset, params, filters).
+    Shared by the probe and the real encodes, so a probed encoder is tried exactly as used.
+    """
+    args = ["-an", "-c:v", encoder["codec"], "-threads", str(os.cpu_count() or 4)]
+    if encoder.get("preset"):
+        args += ["-preset", encoder["preset"]]
+    args += encoder["params"]
+    filters = list(video_filters or []) + encoder.get("filters", [])
+    if filters:
+        args += ["-vf", ",".join(filters)]
+    return args
+
+
+@lru_cache(maxsize=1)
+def _probe_best_encoder() -> dict:
+    """
+    Picks the fastest working H.264 encoder for MoviePy's ffmpeg, once per process.
+    An encoder must be both listed by `ffmpeg -encoders` and pass a tiny trial
+    encode: static ffmpeg builds list NVENC/QSV even on machines without the hardware.
+    """
+    fallback = X264_FALLBACK
+    try:
+        ffmpeg = _ffmpeg_binary()
+        listed = subprocess.run([ffmpeg, "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=10).stdout
+    except Exception as e:
+        logging.warning(f"   ⚠️ Could not probe ffmpeg encoders: {e}")
+        return fallback
+    
+    for codec, opts in HW_ENCODERS.items():
+        if codec not in listed:
+            continue
+        # VAAPI trials hang or fail on runners without a usable render node
+        if codec == "h264_vaapi" and not os.access(VAAPI_DEVICE, os.R_OK | os.W_OK):
+            continue
+        encoder = {"codec": codec, **opts}
+        # Same input pixel format and output args as _encode_scene_video
+        cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", *opts.get("init", []),
+               "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1,format=rgb24",
+               *_encoder_args(encoder), "-f", "null", "-"]
+        try:
+            trial = subprocess.run(cmd, capture_output=True, timeout=20)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logging.warning(f"   ⚠️ Encoder trial for {codec} failed: {e}")
+            continue
+        if trial.returncode == 0:
+            logging.info(f"   🚀 Using hardware encoder: {codec}")
+            return encoder
+    return fallback
+
+
 class EditorEngine:
     """
     Premium COSMIC Video Engine for Western Astrology.
@@ -188,69 +447,280 @@ class EditorEngine:
     Features: Starfield, nebulas, constellation lines, cosmic effects.
     """
     
-    def __init__(self):
+    def __init__(self, low_res_capture: bool = True):
         self.width = 1080
         self.height = 1920
+        
+        # Intermediate frames are captured at 720x1280 and upscaled by ffmpeg on
+        # encode (~2.25x fewer pixels per screenshot). Pass low_res_capture=False for full-HD capture.
+        self.low_res_capture = low_res_capture
+        self.capture_width, self.capture_height = (720, 1280) if low_res_capture else (self.width, self.height)
         self.template_path = os.path.abspath("templates/scene.html")
+        self._template_html = self._load_template()
+
+        # Sign images and styles resolved once for every sign, so scenes never rescan folders
+        self._image_index = {
+            (period, key): path
+            for period in PERIOD_TYPES for key in SIGN_STYLES
+            if (path := _find_sign_image(key, period)) is not None
+        }
+        self._resolved_style = {
+            (key, theme): _resolve_style(key, theme)
+            for key in SIGN_STYLES for theme in (None, *COLOR_STYLES)
+        }
+        self._template_digest = hashlib.blake2b((self._template_html or "").encode("utf-8"), digest_size=8).hexdigest()
         os.makedirs("assets/temp", exist_ok=True)
 
-    def _get_sign_key(self, sign_name: str) -> str:
-        """Extract sign key from name like 'Aries' or 'Aries (fire)'."""
-        sign_key = sign_name.lower().split()[0].split("(")[0].strip()
-        return sign_key
+        # Best available H.264 encoder (NVENC/QSV/VideoToolbox/VAAPI, else x264 veryfast CRF 23)
+        self._best_encoder = _probe_best_encoder()
 
-    def get_sign_image_path(self, sign_name: str, period_type: str = "Daily") -> str:
+        # Content-addressed JPEG frames of finished renders (see _scene_id). Opt-in: it
+        # only pays off where assets/cache survives between runs and scenes recur
+        # (local iteration); capped at FRAME_CACHE_MAX_MB with LRU eviction.
+        self.frame_cache_enabled = os.getenv("EDITOR_FRAME_CACHE", "0") == "1"
+        self.frame_cache_dir = os.path.join("assets", "cache", "frames")
+        # Encoded scenes that recur across videos, e.g. the intro (see load_cached_scene)
+        self.scene_cache_dir = os.path.join("assets", "cache", "scenes")
+
+        # Long-lived Playwright session, created lazily on the first scene and
+        # reused by every scene after it (see _ensure_browser / aclose). It lives on
+        # a dedicated event-loop thread, so scenes can be requested from any thread.
+        self._loop = None
+        self._loop_thread = None
+        self._loop_guard = threading.Lock()
+        self._pw = None
+        self._browser = None
+        self._browser_lock = None
+        # Warm pages (one context each) reused across scenes via window.loadScene
+        self._page_pool = []
+
+        # Deterministic capture via HeadlessExperimental.beginFrame (opt-in:
+        # needs a headless Chromium build that supports BeginFrame control)
+        self.begin_frame_capture = os.getenv("EDITOR_BEGIN_FRAME", "0") == "1"
+
+        # Real-time capture via Playwright's screencast recorder (opt-in: one call per
+        # scene instead of one per frame, but the scene plays at wall-clock speed and
+        # the WebM is lossier than per-frame screenshots)
+        self.record_video_capture = os.getenv("EDITOR_RECORD_VIDEO", "0") == "1"
+
+        # Scenes rendered concurrently by create_scenes_batch (one page each)
+        self.max_parallel_scenes = 4
+        self._scene_slots = None
+
+        # JPEG -> numpy decoding runs off the event loop (Pillow releases the GIL)
+        self._decode_pool = ThreadPoolExecutor(max_workers=4)
+
+        # Finished scenes start their H.264 encode while later scenes are still
+        # capturing; assemble_final reuses those files (see _render_batch)
+        self.pre_encode_scenes = True
+        self._encode_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Mood -> track paths, scanned once instead of listing the folder per video
+        self.music_folder = os.path.join("assets", "music")
+        self._build_music_index()
+
+        # Background beds pre-rendered once per track (looped to MAX_DURATION, volume applied)
+        self.music_cache_dir = os.path.join("assets", "cache", "music")
+        self._precompute_music_cache()
+        # Decoded beds (float32 PCM) per track, reused by every video this engine makes
+        self._music_pcm = {}
+
+    def _load_template(self):
         """
-        Finds the appropriate zodiac sign image using fuzzy matching.
+        Reads the scene template once. Pages load it a single time and then switch
+        scenes through window.loadScene, so the placeholder image slot starts empty.
         """
-        sign_key = self._get_sign_key(sign_name)
+        try:
+            with open(self.template_path, "r", encoding="utf-8") as f:
+                return f.read().replace('{{IMAGE_SRC}}', '')
+        except Exception as e:
+            logging.error(f"❌ Could not read template file: {e}")
+            return None
+
+    async def _ensure_browser(self):
+        """Returns the shared browser, launching Chromium on first use."""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self._browser is None:
+                await self._launch_browser()
+        return self._browser
 
-        # 1. Direct Lookup (Most robust)
-        # Try finding exactly "{sign}.png" in the main photos folder
-        direct_path = os.path.join("assets", "12_photos", f"{sign_key}.png")
-        if os.path.exists(direct_path):
-            return os.path.abspath(direct_path)
+    async def _new_scene_context(self):
+        """
+        Opens an isolated BrowserContext for one scene. Contexts are cheap compared to a
+        browser launch and keep concurrent scenes from sharing storage or compositor state.
+        """
+        browser = await self._ensure_browser()
+        # The template is laid out in 1080x1920 CSS px; a fractional device scale
+        # factor makes Chromium rasterize it directly at the capture resolution.
+        return await browser.new_context(
+            viewport={"width": self.width, "height": self.height},
+            device_scale_factor=self.capture_width / self.width,
+            service_workers="block"
+        )
 
-        # 2. Folder Search (Fallback)
-        folders = ["12_photos"]
-        if period_type == "Monthly": folders.insert(0, "monthly_12_photos")
-        elif period_type == "Yearly": folders.insert(0, "yearly_12_photos")
+    async def _acquire_scene_page(self):
+        """
+        Returns an idle (context, page, cdp) triple with the template already loaded,
+        opening a new one only when every warm page is busy.
+        """
+        if self._page_pool:
+            return self._page_pool.pop()
         
-        # Translate using map if available
-        mapped_key = SIGN_IMAGE_MAP.get(sign_key, sign_key)
+        context = await self._new_scene_context()
+        try:
+            if self.begin_frame_capture:
+                page = await self._new_begin_frame_page(context)
+            else:
+                page = await context.new_page()
+            await page.set_content(self._template_html, wait_until="load")
+        except Exception:
+            await context.close()
+            raise
         
-        search_keys = [mapped_key, sign_key]
-        search_keys = list(dict.fromkeys(filter(None, search_keys)))
+        # Raw CDP session: one reusable channel for every frame of this page
+        cdp = None
+        try:
+            cdp = await context.new_cdp_session(page)
+        except Exception as e:
+            if self.begin_frame_capture:
+                # A BeginFrame-controlled page only draws over CDP
+                await context.close()
+                raise
+            logging.warning(f"   ⚠️ CDP session unavailable, using page.screenshot: {e}")
+        return context, page, cdp
+
+    async def _new_begin_frame_page(self, context):
+        """
+        Opens a page in context whose compositor is driven by BeginFrame. Playwright
+        can't create such targets itself, so it goes through Target.createTarget and
+        Playwright picks the page up like any other page of the context.
+        """
+        placeholder = await context.new_page()
+        browser_cdp = await self._browser.new_browser_cdp_session()
+        try:
+            info = await (await context.new_cdp_session(placeholder)).send("Target.getTargetInfo")
+            async with context.expect_page() as page_info:
+                await browser_cdp.send("Target.createTarget", {
+                    "url": "about:blank",
+                    "browserContextId": info["targetInfo"]["browserContextId"],
+                    "enableBeginFrameControl": True,
+                })
+            return await page_info.value
+        finally:
+            await browser_cdp.detach()
+            await placeholder.close()
+
+    async def _release_scene_page(self, slot, reusable: bool = True):
+        """Returns a page to the warm pool, or closes it if its last scene failed."""
+        if reusable and self._browser is not None:
+            self._page_pool.append(slot)
+            return
+        try:
+            await slot[0].close()
+        except Exception:
+            pass
+
+    async def _launch_browser(self):
+        """Starts Playwright and the shared Chromium browser."""
+        args = list(CHROMIUM_ARGS)
+        if self.begin_frame_capture:
+            # Frames are produced only on BeginFrame, with every compositor stage
+            # finished before the screenshot and no timeout blanking new content
+            args += [
+                "--enable-begin-frame-control",
+                "--run-all-compositor-stages-before-draw",
+                "--disable-new-content-rendering-timeout",
+            ]
         
-        for folder in folders:
-            folder_path = os.path.join("assets", folder)
-            if not os.path.exists(folder_path): continue
-            
-            try:
-                files = os.listdir(folder_path)
-                for f in files:
-                    fname_lower = f.lower()
-                    for key in search_keys:
-                        if key and key in fname_lower:
-                             return os.path.abspath(os.path.join(folder_path, f))
-            except Exception as e:
-                logging.warning(f"Error scanning folder {folder}: {e}")
-                
-        return None
+        self._pw = await async_playwright().start()
+        self._browser = await self._pw.chromium.launch(headless=True, args=args)
+        if self.begin_frame_capture and not await self._begin_frame_works():
+            # Under the flag ordinary pages never draw, so relaunch without it
+            await self._browser.close()
+            self._browser = await self._pw.chromium.launch(headless=True, args=list(CHROMIUM_ARGS))
+            self.begin_frame_capture = False
+        logging.info("   🌌 Playwright browser launched (shared across scenes)")
+
+    async def _begin_frame_works(self) -> bool:
+        """Renders one BeginFrame on a throwaway page (with a timeout) before committing to it."""
+        context = await self._browser.new_context(viewport={"width": self.width, "height": self.height})
+        try:
+            page = await self._new_begin_frame_page(context)
+            cdp = await context.new_cdp_session(page)
+            await asyncio.wait_for(self._begin_frame(cdp, time.monotonic() * 1000, 30), BEGIN_FRAME_TIMEOUT)
+            return True
+        except Exception as e:
+            logging.warning(f"   ⚠️ BeginFrame capture unavailable ({e!r}). Using seek + screenshot.")
+            return False
+        finally:
+            await context.close()
+
+    async def _aclose(self):
+        """Closes the shared browser session, if one was started (runs on the engine loop)."""
+        try:
+            if self._browser: await self._browser.close()
+            if self._pw: await self._pw.stop()
+        except Exception as e:
+            logging.warning(f"   ⚠️ Error while closing Playwright: {e}")
+        finally:
+            self._pw = self._browser = None
+            self._page_pool = []
+
+    async def aclose(self):
+        """Async wrapper around _aclose() for callers on their own event loop."""
+        if self._browser is None:
+            return
+        # Already on the engine loop (e.g. from a coroutine it runs): waiting on a
+        # future scheduled onto this same loop would never complete
+        if asyncio.get_running_loop() is self._loop:
+            await self._aclose()
+        else:
+            await asyncio.wrap_future(self._submit(self._aclose()))
+
+    def _ensure_loop(self):
+        """Starts the engine's event-loop thread on first use."""
+        with self._loop_guard:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever, name="editor-playwright", daemon=True)
+                self._loop_thread.start()
+        return self._loop
+
+    def _submit(self, coro):
+        """Schedules a coroutine on the engine loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def _run(self, coro):
+        """
+        Runs a coroutine on the engine's loop thread and blocks for the result.
+        Safe to call from any thread; concurrent callers share the browser and the
+        max_parallel_scenes slots.
+        """
+        return self._submit(coro).result()
+
+    def close(self):
+        """Synchronous wrapper around aclose()."""
+        if self._browser is not None:
+            self._run(self._aclose())
+
+    def _get_sign_key(self, sign_name: str) -> str:
+        """Extract sign key from name like 'Aries' or 'Aries (fire)'."""
+        return _get_sign_key(sign_name)
+
+    def get_sign_image_path(self, sign_name: str, period_type: str = "Daily") -> str:
+        """
+        Finds the appropriate zodiac sign image using fuzzy matching.
+        """
+        sign_key = _get_sign_key(sign_name)
+        path = self._image_index.get((period_type, sign_key))
+        return path if path is not None else _find_sign_image(sign_key, period_type)
 
     def _image_to_base64(self, image_path: str) -> str:
         """Encodes an image file to a base64 string."""
-        import base64
         try:
-            with open(image_path, "rb") as img_file:
-                b64_string = base64.b64encode(img_file.read()).decode('utf-8')
-                # Determine mime type (assume png for simplicity or detect)
-                mime_type = "image/png"
-                if image_path.lower().endswith(".jpg") or image_path.lower().endswith(".jpeg"):
-                    mime_type = "image/jpeg"
-                elif image_path.lower().endswith(".webp"):
-                    mime_type = "image/webp"
-                return f"data:{mime_type};base64,{b64_string}"
+            return _image_to_b64_cached(image_path)
         except Exception as e:
             logging.warning(f"Failed to encode image {image_path}: {e}")
             return ""
@@ -260,27 +730,11 @@ class EditorEngine:
         Renders the cosmic scene using Playwright.
         Captures screenshots at 30 FPS.
         """
-        frames_dir = f"assets/temp/frames_{hash(text)}"
-        os.makedirs(frames_dir, exist_ok=True)
-        
         sign_img_path = self.get_sign_image_path(sign_name, period_type)
-        sign_key = self._get_sign_key(sign_name)
-        
-        # Get style: COLOR_THEME > SIGN_STYLES > Fallback
-        style = None
-        if theme_override and theme_override in COLOR_STYLES:
-            style = COLOR_STYLES[theme_override]
-        
-        if not style:
-             style = SIGN_STYLES.get(sign_key)
-             
-        if not style:
-             # Default cosmic purple theme
-             style = {
-                 "grad": ("#0a0515", "#140a2a", "#9c27b0"),
-                 "glow": "#ce93d8",
-                 "element": "neutral"
-             }
+        sign_key = _get_sign_key(sign_name)
+        
+        # Get style: COLOR_THEME > SIGN_STYLES > Fallback (pre-resolved at startup)
+        style = self._resolved_style.get((sign_key, theme_override)) or _resolve_style(sign_key, theme_override)
         
         grad = style["grad"]
         glow = style["glow"]
@@ -294,183 +748,519 @@ class EditorEngine:
         else:
             logging.warning(f"   ⚠️ Zodiac Image NOT found: {sign_img_path}")
             
-        # Construct URL with params (Passing headers, but image is handled via JS variable injection if too long, or param)
-        # Base64 strings can be long, passing via URL might hit limits. 
-        # Safer strategy: Write a temp HTML file with injected variables? 
-        # OR: Just pass it if it's not huge (Icons are usually small).
-        # Let's try passing via JS injection after page load, OR just URL if < 2MB. 
-        # Playwright evaluate is safest.
-        
-        # --- REFACTOR: TEMP FILE WRITING ---
-        # The most reliable way to handle large Base64 images and complex text is to 
-        # write a temporary HTML file with everything "baked in" (static HTML).
-        # This bypasses all URL limits and JS injection timing issues.
-        
-        try:
-            with open(self.template_path, "r", encoding="utf-8") as f:
-                html_template = f.read()
-        except Exception as e:
-            logging.error(f"❌ Could not read template file: {e}")
+        if self._template_html is None:
+            logging.error("❌ Scene template is not loaded.")
             return []
-
-        # 1. Prepare Content
-        safe_header = header_text.replace('"', '&quot;').replace("'", "&apos;")
-        safe_text = text.replace('"', '&quot;').replace('\n', ' ')
-        
-        # 2. Inject CSS Variables via Style Block (Bypassing JS injection for styles)
-        # also adding explicit header-text styling in case it was missing
-        css_block = f"""
-        <style>
-            :root {{
-                --c1: {grad[0]};
-                --c2: {grad[1]};
-                --c3: {grad[2]};
-                --glow: {glow};
-            }}
-            .element-glow {{ background: radial-gradient(ellipse at 50% 30%, {glow} 0%, transparent 50%); }}
-            
-            /* FORCE HEADER STYLING */
-            #header-text {{
-                position: absolute;
-                top: 80px; 
-                width: 100%;
-                text-align: center;
-                font-family: 'Cinzel', serif;
-                font-size: 60px;
-                color: #FFD700;
-                text-shadow: 0 0 20px #FFD700;
-                z-index: 20;
-                opacity: 1 !important; /* Force visible */
-            }}
-        </style>
-        """
-        
-        # 3. Create the Hydrated HTML
-        # We replace specific placeholders or append a script that runs IMMEDIATELY
-        # But even better, we simply replace the empty tags in the template with filled ones.
-        
-        final_html = html_template
-        final_html = final_html.replace('</head>', f'{css_block}</head>')
-        
-        # HARD REPLACEMENT of Content for 100% Reliability
-        # Using a regex-like replace or just string replace if we know the structure
-        # Replacing the empty <div id="header-text"></div> with filled one
-        final_html = final_html.replace('<div id="header-text"></div>', f'<div id="header-text">{safe_header}</div>')
-        
-        # Replacing the Image Tag via Explicit Placeholder
-        # This is the most robust method
+        
+        # Everything scene-specific goes to window.loadScene on a page that already
+        # has the template loaded; the template itself is parsed once per page.
         if sign_img_b64:
              logging.info(f"   🖼️ Injecting Base64 Image ({len(sign_img_b64)} chars)")
-             final_html = final_html.replace('{{IMAGE_SRC}}', sign_img_b64)
-        else:
-             # Clean up placeholder if no image
-             final_html = final_html.replace('{{IMAGE_SRC}}', '')
-        
-        # Inject Data for JS (still needed for word highlighting/splitting)
-        # CRITICAL FIX: Set imgSrc to "" so JS doesn't overwrite our baked-in base64 src!
-        injection_script = f"""
-        <script>
-            window.INJECTED_DATA = {{
-                text: "{safe_text}",
-                header: "{safe_header}",
-                animStyle: "{anim_style}",
-                imgSrc: "" 
-            }};
-        </script>
-        """
-        final_html = final_html.replace('<body>', f'<body>{injection_script}')
-        
-        # 4. Write to Temp File
-        if len(safe_header) > 10:
-             # sanitise filename
-             safe_fname = "".join(x for x in safe_header if x.isalnum())[:20]
-        else:
-             safe_fname = f"scene_{hash(text)}"
-             
-        temp_html_path = os.path.abspath(f"assets/temp/{safe_fname}.html")
+        scene = {
+            "text": text.replace('\n', ' '),
+            "header": header_text,
+            "animStyle": anim_style,
+            "imgSrc": sign_img_b64,
+            "c1": grad[0],
+            "c2": grad[1],
+            "c3": grad[2],
+            "glow": glow,
+            "element": element,
+            # Precomputed static glow in the style's glow colour (every style, neutral
+            # included): a stretched image instead of a per-frame radial-gradient
+            "backdrop": _backdrop_data_uri(glow),
+        }
+        
+        # Karaoke: the active word for every frame is resolved up front in one
+        # vectorised pass; it is both the page's highlight table and part of the cache key
+        total_frames = int(duration * 30)
+        active_by_frame = _active_word_by_frame(subtitle_data, total_frames, 30).tolist() if subtitle_data else None
+        
+        # Identical render inputs -> identical frames: reuse a complete cached render
+        cache_dir = None
+        if self.frame_cache_enabled:
+            scene_id = self._scene_id(scene, sign_img_path, active_by_frame, total_frames)
+            cache_dir = os.path.join(self.frame_cache_dir, scene_id)
+            # Off the loop thread: other scenes keep capturing while the manifest is read
+            if await asyncio.to_thread(self._cached_frames_complete, cache_dir, total_frames):
+                logging.info(f"   ♻️ Frame cache hit ({scene_id}). Skipping Playwright.")
+                # Mark as recently used for eviction
+                await asyncio.to_thread(os.utime, self._manifest_path(cache_dir))
+                return await self._load_cached_frames(cache_dir, total_frames)
+        
+        logging.info(f"   🌌 Rendering with Playwright ({anim_style.upper()})")
         
+        if self._scene_slots is None:
+            self._scene_slots = asyncio.Semaphore(self.max_parallel_scenes)
+        
+        async with self._scene_slots:
+            # (not under BeginFrame control, where ordinary pages never draw)
+            if self.record_video_capture and not self.begin_frame_capture:
+                try:
+                    return await self._record_frames(scene, total_frames, active_by_frame)
+                except Exception as e:
+                    logging.warning(f"   ⚠️ Screencast recording failed ({e}). Falling back to screenshots.")
+            return await self._capture_frames(scene, total_frames, active_by_frame, cache_dir)
+
+    def _scene_id(self, scene: dict, image_path, active_by_frame, total_frames: int) -> str:
+        """
+        Stable (PYTHONHASHSEED-independent) id for what actually reaches the page: the
+        resolved style rather than sign/theme/period, the sign image by file identity,
+        and the per-frame karaoke table rather than raw subtitle timings. Inputs that
+        render the same pixels therefore share one cache entry.
+        """
+        image_id = None
+        if image_path and os.path.exists(image_path):
+            st = os.stat(image_path)
+            image_id = [os.path.abspath(image_path), st.st_size, int(st.st_mtime)]
+        page_inputs = {k: v for k, v in scene.items() if k not in ("imgSrc", "backdrop")}
+        key = json.dumps(
+            [page_inputs, image_id, active_by_frame, total_frames,
+             self.capture_width, self.capture_height, FRAME_FORMAT, JPEG_QUALITY, self._template_digest],
+            sort_keys=True, default=str
+        )
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+    @staticmethod
+    def _frame_path(cache_dir: str, idx: int) -> str:
+        ext = "jpg" if FRAME_FORMAT == "jpeg" else FRAME_FORMAT
+        return os.path.join(cache_dir, f"frame_{idx:04d}.{ext}")
+
+    @staticmethod
+    def _manifest_path(cache_dir: str) -> str:
+        return os.path.join(cache_dir, "manifest.json")
+
+    def _cached_frames_complete(self, cache_dir: str, total_frames: int) -> bool:
+        """
+        A render is complete once its manifest exists: it is written only after every
+        frame has landed, so one read replaces a stat per frame.
+        """
         try:
-             with open(temp_html_path, "w", encoding="utf-8") as f:
-                 f.write(final_html)
-        except Exception as e:
-             logging.error(f"❌ Failed to write temp html: {e}")
-             return []
+            with open(self._manifest_path(cache_dir), "r", encoding="utf-8") as f:
+                return json.load(f).get("frames") == total_frames
+        except (OSError, ValueError):
+            return False
+
+    def _write_manifest(self, cache_dir: str, total_frames: int):
+        path = self._manifest_path(cache_dir)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"frames": total_frames, "format": FRAME_FORMAT}, f)
+        os.replace(path + ".tmp", path)
 
-        full_file_url = f"file:///{temp_html_path.replace(os.sep, '/')}"
-        logging.info(f"   🌌 Launching Playwright ({anim_style.upper()}) -> {full_file_url}")
+    def _prune_frame_cache(self, keep_dir: str = None):
+        """
+        Evicts least recently used renders (by manifest mtime) until the frame cache
+        fits FRAME_CACHE_MAX_MB. Renders without a manifest that are over an hour old
+        are leftovers of interrupted captures and go first.
+        """
+        try:
+            names = os.listdir(self.frame_cache_dir)
+        except OSError:
+            return
+        
+        entries, total = [], 0
+        now = time.time()
+        for name in names:
+            entry = os.path.join(self.frame_cache_dir, name)
+            if entry == keep_dir or not os.path.isdir(entry):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in os.scandir(entry) if f.is_file())
+                manifest = self._manifest_path(entry)
+                if os.path.exists(manifest):
+                    used = os.path.getmtime(manifest)
+                elif now - os.path.getmtime(entry) > 3600:
+                    used = 0.0
+                else:
+                    continue  # capture still in progress
+            except OSError:
+                continue
+            entries.append((used, size, entry))
+            total += size
+        if keep_dir and os.path.isdir(keep_dir):
+            total += sum(f.stat().st_size for f in os.scandir(keep_dir) if f.is_file())
         
-        frames = []
+        limit = FRAME_CACHE_MAX_MB * 1024 * 1024
+        for used, size, entry in sorted(entries):
+            if total <= limit and used > 0:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    async def _load_cached_frames(self, cache_dir: str, total_frames: int):
+        """Decodes a cached render from disk into a fresh frame store."""
+        frames = np.empty((total_frames, self.capture_height, self.capture_width, 3), dtype=np.uint8)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(self._decode_pool, self._decode_file_into, frames, i, self._frame_path(cache_dir, i))
+            for i in range(total_frames)
+        ])
+        return frames
+
+    async def _capture_frames(self, scene, total_frames, active_by_frame=None, cache_dir=None):
+        """
+        Loads the scene into a warm page of the shared browser and captures its frames.
+        Frames are grabbed as in-memory JPEGs and returned as RGB numpy arrays (no disk round-trip).
+        """
         fps = 30
-        total_frames = int(duration * fps)
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-setuid-sandbox"]
-            )
-            page = await browser.new_page(viewport={"width": 1080, "height": 1920})
+        
+        # Preallocated frame store: decoders write by index, so order needs no merge
+        frames = np.empty((total_frames, self.capture_height, self.capture_width, 3), dtype=np.uint8)
+        queue = asyncio.Queue(maxsize=8)
+        decode_errors = []
+        
+        async def decode_worker():
+            loop = asyncio.get_running_loop()
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        return
+                    idx, jpeg = item
+                    await loop.run_in_executor(self._decode_pool, self._decode_into, frames, idx, jpeg, cache_dir)
+                except Exception as e:
+                    decode_errors.append(e)
+                finally:
+                    queue.task_done()
+        
+        slot = await self._acquire_scene_page()
+        _, page, cdp = slot
+        decoders = [asyncio.create_task(decode_worker()) for _ in range(2)]
+        reusable = False
+        
+        try:
+            # Swap the scene in place; resolves once fonts and the sign image are ready
+            word_count = await page.evaluate("(scene) => window.loadScene(scene)", scene)
+            if scene["text"].strip() and not word_count:
+                logging.warning("   ⚠️ Scene loaded without any words. Continuing anyway...")
             
-            # Load the Temp File
-            await page.goto(full_file_url)
+            # Karaoke table goes to the page once; frames just index into it
+            if active_by_frame:
+                await page.evaluate("([table, fps]) => window.loadActiveByFrame(table, fps)", [active_by_frame, fps])
             
-            # Wait for text container to be populated by JS
-            try:
-                await page.wait_for_selector(f"#text-container .word", timeout=5000)
-            except:
-                logging.warning("   ⚠️ Text container load timed out. Continuing anyway...")
+            use_begin_frame = self.begin_frame_capture
+            if use_begin_frame:
+                await page.evaluate("window.startFrameClock()")
             
-            logging.info(f"   ✨ Capturing {total_frames} cosmic frames...")
+            backend = "beginframe" if use_begin_frame else ("cdp" if cdp else "playwright")
+            logging.info(f"   ✨ Capturing {total_frames} cosmic frames (Screenshot Backend: {backend})...")
             
+            frame_base_ms = time.monotonic() * 1000
+            buf = None
             for i in range(total_frames):
                 current_time = i / fps
                 
-                # 1. Update Karaoke Highlight
-                if subtitle_data:
-                    active_idx = -1
-                    for idx, sub in enumerate(subtitle_data):
-                        end_time = sub.get('end', sub['start'] + sub.get('duration', 0.5))
-                        if sub['start'] <= current_time < end_time:
-                            active_idx = idx
-                            break
-                    
-                    if active_idx != -1:
-                         await page.evaluate(f"window.setWordActive({active_idx})")
-                
-                # 2. Update Animations (GSAP seek)
-                await page.evaluate(f"window.seek({current_time})")
+                if use_begin_frame:
+                    # One round-trip: advance virtual time, run the rAF tick, screenshot.
+                    # The page only draws on BeginFrame, so a plain screenshot can't stand
+                    # in; the timeout fails the scene instead of stalling it.
+                    buf = await asyncio.wait_for(
+                        self._begin_frame(cdp, frame_base_ms + i * 1000 / fps, fps), BEGIN_FRAME_TIMEOUT
+                    ) or buf
+                    if buf is None:
+                        raise RuntimeError("BeginFrame produced no first frame")
+                else:
+                    # Seek animations and karaoke highlight in one call, then capture
+                    await self._render_at(page, cdp, current_time)
+                    buf = await self._grab_frame(page, cdp)
                 
-                # 3. Capture Frame
-                frame_path = os.path.join(frames_dir, f"frame_{i:04d}.png")
-                await page.screenshot(path=frame_path, type='png')
-                frames.append(frame_path)
-            
-            await browser.close()
+                # Hand off to the decoders; capture of the next frame overlaps the decode
+                await queue.put((i, buf))
+            if use_begin_frame:
+                await page.evaluate("window.stopFrameClock()")
+            reusable = True
+        finally:
+            for _ in decoders:
+                await queue.put(None)
+            await asyncio.gather(*decoders)
+            await self._release_scene_page(slot, reusable)
+        
+        if decode_errors:
+            raise decode_errors[0]
+        if cache_dir:
+            await asyncio.to_thread(self._write_manifest, cache_dir, total_frames)
+            await asyncio.to_thread(self._prune_frame_cache, cache_dir)
+        return frames
+
+    async def _record_frames(self, scene, total_frames, active_by_frame=None):
+        """
+        Plays the scene in real time inside a recording context and samples the
+        resulting WebM into the frame store. Not written to the frame cache (lossy).
+        """
+        from moviepy.editor import VideoFileClip
+        
+        fps = 30
+        browser = await self._ensure_browser()
+        record_dir = os.path.join("assets", "temp", "recordings")
+        context = await browser.new_context(
+            viewport={"width": self.width, "height": self.height},
+            device_scale_factor=self.capture_width / self.width,
+            service_workers="block",
+            record_video_dir=record_dir,
+            record_video_size={"width": self.capture_width, "height": self.capture_height}
+        )
+        video_path = None
+        try:
+            page = await context.new_page()
+            # Recording starts with the page; the lead-in before the clock starts is skipped below
+            opened = time.monotonic()
+            await page.set_content(self._template_html, wait_until="load")
+            await page.evaluate("(scene) => window.loadScene(scene)", scene)
+            if active_by_frame:
+                await page.evaluate("([table, fps]) => window.loadActiveByFrame(table, fps)", [active_by_frame, fps])
             
-            # Cleanup Temp File
+            logging.info(f"   ✨ Recording {total_frames / fps:.1f}s of cosmic frames (Screenshot Backend: screencast)...")
+            await page.evaluate("window.startFrameClock()")
+            lead = time.monotonic() - opened
+            await asyncio.sleep(total_frames / fps + 0.2)
+            await page.evaluate("window.stopFrameClock()")
+            video_path = await page.video.path()
+        finally:
+            # The WebM is only finalized once its context closes
+            await context.close()
+        
+        def sample():
+            frames = np.empty((total_frames, self.capture_height, self.capture_width, 3), dtype=np.uint8)
+            clip = VideoFileClip(video_path, audio=False, target_resolution=(self.capture_height, self.capture_width))
             try:
-                 os.remove(temp_html_path)
-            except: pass
-            
-        return frames
+                last = max(0.0, clip.duration - 1.0 / fps)
+                for i in range(total_frames):
+                    frames[i] = clip.get_frame(min(lead + i / fps, last))
+            finally:
+                clip.close()
+                os.remove(video_path)
+            return frames
+        
+        return await asyncio.get_running_loop().run_in_executor(self._decode_pool, sample)
+
+    @classmethod
+    def _decode_into(cls, frames, idx: int, jpeg: bytes, cache_dir: str = None):
+        """
+        Decodes one JPEG screenshot into its slot of the frame store (runs in the decode pool).
+        When cache_dir is given the raw JPEG is also kept for later identical renders.
+        """
+        cls._store_image(frames, idx, Image.open(io.BytesIO(jpeg)))
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            path = cls._frame_path(cache_dir, idx)
+            # Write-then-rename so an interrupted run never leaves a truncated frame
+            with open(path + ".tmp", "wb") as f:
+                f.write(jpeg)
+            os.replace(path + ".tmp", path)
+
+    @classmethod
+    def _decode_file_into(cls, frames, idx: int, path: str):
+        with Image.open(path) as img:
+            cls._store_image(frames, idx, img)
+
+    @staticmethod
+    def _store_image(frames, idx: int, img):
+        """
+        Copies a decoded image into its preallocated slot. Screenshots already decode
+        as RGB, and convert("RGB") would still copy the full frame, so it only runs for
+        other modes; the pixels go straight from PIL's buffer into the frame store.
+        """
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        frames[idx] = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(frames.shape[1:])
+
+    async def _render_at(self, page, cdp, t: float):
+        """
+        Puts the page at time t. On the CDP path this is a bare Runtime.evaluate on the
+        same session as the screenshot: no Playwright argument/handle marshalling, and the
+        seek is ordered ahead of the capture that follows it.
+        """
+        if cdp is not None:
+            resp = await cdp.send("Runtime.evaluate", {"expression": f"window.renderAt({t})", "returnByValue": True})
+            if "exceptionDetails" in resp:
+                raise Exception(f"renderAt({t}) failed: {resp['exceptionDetails'].get('text')}")
+            return
+        await page.evaluate(f"window.renderAt({t})")
+
+    async def _grab_frame(self, page, cdp=None) -> bytes:
+        """Captures the viewport as JPEG/WebP bytes (FRAME_FORMAT), via raw CDP when a session is available."""
+        if cdp is not None:
+            resp = await cdp.send("Page.captureScreenshot", {
+                "format": FRAME_FORMAT,
+                "quality": JPEG_QUALITY,
+                "captureBeyondViewport": False,
+                "optimizeForSpeed": True  # faster encoder settings; ignored by older Chromium
+            })
+            return base64.b64decode(resp["data"])
+        # Playwright's screenshot API has no WebP; Pillow sniffs the bytes either way
+        return await page.screenshot(type='jpeg', quality=JPEG_QUALITY)
+
+    async def _begin_frame(self, cdp, frame_time_ms: float, fps: int):
+        """
+        Renders exactly one frame at a virtual time and returns it as JPEG bytes.
+        Returns None when the compositor reports no damage (frame unchanged).
+        """
+        resp = await cdp.send("HeadlessExperimental.beginFrame", {
+            "frameTimeTicks": frame_time_ms,
+            "interval": 1000 / fps,
+            "screenshot": {"format": FRAME_FORMAT, "quality": JPEG_QUALITY}
+        })
+        data = resp.get("screenshotData")
+        return base64.b64decode(data) if data else None
 
     def create_scene(self, sign_name: str, text: str, duration: float, subtitle_data: list = None, theme_override: str = None, header_text: str = "", period_type: str = "Daily"):
         """Wrapper to run async render synchronously. Uses cosmic animation styles."""
+        return self.create_scenes_batch([{
+            "sign_name": sign_name,
+            "text": text,
+            "duration": duration,
+            "subtitle_data": subtitle_data,
+            "theme_override": theme_override,
+            "header_text": header_text,
+            "period_type": period_type,
+        }])[0]
+
+    def create_scenes_batch(self, scene_specs: list) -> list:
+        """
+        Renders several scenes in one event-loop run, up to max_parallel_scenes at a time.
+        Each spec is a dict of create_scene keyword arguments.
+        Returns one clip per spec, in order (None where a scene failed).
+        """
+        return self._run(self.create_scenes_batch_async(scene_specs))
+
+    async def create_scene_async(self, sign_name: str, text: str, duration: float, subtitle_data: list = None, theme_override: str = None, header_text: str = "", period_type: str = "Daily"):
+        """
+        Async-native create_scene for callers that already run an event loop.
+        The render itself runs on the engine loop; the caller's loop just awaits it.
+        """
+        clip = (await self.create_scenes_batch_async([{
+            "sign_name": sign_name,
+            "text": text,
+            "duration": duration,
+            "subtitle_data": subtitle_data,
+            "theme_override": theme_override,
+            "header_text": header_text,
+            "period_type": period_type,
+        }]))[0]
+        return clip
+
+    async def create_scenes_batch_async(self, scene_specs: list) -> list:
+        """Async counterpart of create_scenes_batch (same specs, same None-on-failure results)."""
+        if self._loop is not None and asyncio.get_running_loop() is self._loop:
+            results = await self._render_batch(scene_specs)
+        else:
+            results = await asyncio.wrap_future(self._submit(self._render_batch(scene_specs)))
+        
+        clips = []
+        for result in results:
+            if isinstance(result, Exception):
+                logging.error(f"❌ Playwright Render Error: {result}")
+                clips.append(None)
+            else:
+                clips.append(result)
+        return clips
+
+    @staticmethod
+    def _frames_to_clip(frames, fps: int = 30):
+        """
+        Wraps a contiguous (N, H, W, 3) frame store in a VideoClip.
+        Frames are served straight from the array, with no per-frame decode or copy.
+        The array is held in clip.frame_store so it can be released once the scene
+        is encoded (see _render_batch); after that only prepared_encode has the pixels.
+        """
+        store = [frames]
+        last = len(frames) - 1
+        
+        def make_frame(t):
+            if store[0] is None:
+                raise RuntimeError("Scene frames were released after pre-encoding; use clip.prepared_encode.")
+            # Round, don't truncate: t = k / fps times fps lands just below k for many k
+            return store[0][min(int(round(t * fps)), last)]
+        
+        clip = VideoClip(make_frame, duration=len(frames) / fps).set_fps(fps)
+        clip.frame_store = store
+        return clip
+
+    async def _render_batch(self, scene_specs: list) -> list:
+        """Renders all specs concurrently on the shared browser; returns clips (or exceptions)."""
         # Use consistent cosmic animation style as requested
         chosen_style = "cosmic" # random.choice(COSMIC_ANIM_STYLES)
         
-        try:
-            frames = asyncio.run(self._render_html_scene(sign_name, text, duration, subtitle_data, theme_override, header_text, period_type, chosen_style))
-            
-            if not frames:
+        async def render(spec):
+            frames = await self._render_html_scene(anim_style=chosen_style, **spec)
+            if frames is None or len(frames) == 0:
                 raise Exception("No frames captured")
+            clip = self._frames_to_clip(frames)
+            if self.pre_encode_scenes:
+                # Start this scene's H.264 encode now, while later scenes are still capturing
+                path = os.path.join("assets", "temp", f"scene_{uuid.uuid4().hex[:12]}.mp4")
+                future = self._encode_pool.submit(self._encode_scene_video, clip, path, len(frames))
+                clip.prepared_encode = (future, path, len(frames))
                 
-            clip = ImageSequenceClip(frames, fps=30)
+                # Raw frames are ~2.7 MB each at capture size; once the scene is on disk as
+                # H.264 drop them, so a run never holds more than the scenes still encoding.
+                # A failed encode keeps them for assemble_final's fallback.
+                def release(f, store=clip.frame_store):
+                    if not f.cancelled() and f.exception() is None:
+                        store[0] = None
+                future.add_done_callback(release)
+            return clip
+        
+        return await asyncio.gather(*[render(spec) for spec in scene_specs], return_exceptions=True)
+
+    def _scene_cache_path(self, key: str) -> str:
+        """Encoded-scene cache file for key; tied to the template and encoder so concat copy stays valid."""
+        return os.path.join(self.scene_cache_dir, f"{key}_{self._template_digest}_{self._best_encoder['codec']}.mp4")
+
+    def load_cached_scene(self, key: str):
+        """
+        Returns a clip for a scene stored with store_cached_scene, or None on a miss.
+        The stored H.264 file is handed to assemble_final as the scene's pre-encode,
+        so it is concatenated as-is instead of being rendered or encoded again.
+        """
+        path = self._scene_cache_path(key)
+        meta_path = os.path.splitext(path)[0] + ".json"
+        if not (os.path.exists(path) and os.path.exists(meta_path)):
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                n_frames = int(json.load(f)["frames"])
+            # Only the size/duration are needed (pixels come from the file), so the
+            # reader is closed straight away
+            clip = VideoFileClip(path, audio=False)
+            clip.close()
+            clip = clip.set_duration(n_frames / 30)
+            # assemble_final deletes pre-encodes when done, so give it a temp copy
+            tmp_path = os.path.join("assets", "temp", f"scene_{uuid.uuid4().hex[:12]}.mp4")
+            shutil.copyfile(path, tmp_path)
+            done = Future()
+            done.set_result(None)
+            clip.prepared_encode = (done, tmp_path, n_frames)
+            logging.info(f"   ♻️ Scene cache hit ({key}).")
             return clip
-            
         except Exception as e:
-            logging.error(f"❌ Playwright Render Error: {e}")
+            logging.warning(f"   ⚠️ Cached scene unusable ({e}). Rendering fresh.")
             return None
 
+    def store_cached_scene(self, key: str, clip):
+        """Saves a rendered scene's H.264 encode for load_cached_scene (reuses its pre-encode if any)."""
+        path = self._scene_cache_path(key)
+        meta_path = os.path.splitext(path)[0] + ".json"
+        os.makedirs(self.scene_cache_dir, exist_ok=True)
+        tmp_path = path + ".tmp.mp4"
+        try:
+            prepared = getattr(clip, "prepared_encode", None)
+            if prepared:
+                prepared[0].result()
+                shutil.copyfile(prepared[1], tmp_path)
+                n_frames = prepared[2]
+            else:
+                n_frames = round(clip.duration * 30)
+                self._encode_scene_video(clip, tmp_path, n_frames)
+            os.replace(tmp_path, path)
+            # Exact frame count, so assemble_final can match it against its frame ranges
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"frames": n_frames}, f)
+        except Exception as e:
+            logging.warning(f"   ⚠️ Could not cache scene {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def assemble_final(self, scenes: list, output_path: str, mood: str = "peaceful", sign_name: str = None):
         """Assembles all scenes into final cosmic video with background music."""
         if not scenes:
@@ -482,68 +1272,294 @@ class EditorEngine:
             logging.error("All scenes failed to render.")
             return
 
+        # All scenes are rendered by now; release Chromium before the encode.
+        self.close()
+
         logging.info(f"🌟 Assembling {len(scenes)} cosmic scenes...")
-        final_video = run_concatenate(scenes) 
+        # Video is joined from the per-scene files below, so only the audio is laid out
+        # here: each scene's narration placed at its start time on the shared timeline.
+        # (A moviepy video concat would pull frames the pre-encodes have already released.)
+        tracks, t = [], 0.0
+        for clip in scenes:
+            if clip.audio is not None:
+                tracks.append(clip.audio.set_start(t))
+            t += clip.duration
+        total_duration = t
         
         # --- ADD BACKGROUND MUSIC ---
         music_path = self._select_music_by_mood(mood, sign_name)
         if music_path:
             try:
                 logging.info(f"   🎵 Adding background music: {os.path.basename(music_path)}")
-                music = AudioFileClip(music_path)
-                
-                # Loop music if shorter than video
-                if music.duration < final_video.duration:
-                    music = vfx.loop(music, duration=final_video.duration)
-                else:
-                    music = music.subclip(0, final_video.duration)
-                
-                # Lower content volume significantly (background)
-                music = music.volumex(0.02)  # Reduced to near-silent (2%) based on feedback
-                
-                # Mix audio
-                original_audio = final_video.audio
-                final_audio = CompositeAudioClip([original_audio, music])
-                final_video = final_video.set_audio(final_audio)
-                
+                tracks.append(self._music_clip(music_path, total_duration))
             except Exception as e:
                 logging.warning(f"   ⚠️ Could not add background music: {e}")
+        final_audio = CompositeAudioClip(tracks).set_duration(total_duration) if tracks else None
 
         # --- FADE OUT & LIMIT ---
-        # Add 1 second Fade Out for smooth ending
-        final_video = final_video.fadeout(1.0) # Audio fadeout
-        # Video fadeout requires crossfade or just fadeout effect if supported, manual fadeout:
-        final_video = vfx.fadeout(final_video, 1.0)
-        
-        MAX_DURATION = 59.0
-        if final_video.duration > MAX_DURATION:
-            logging.warning(f"⚠️ Video duration {final_video.duration}s exceeds {MAX_DURATION}s. Trimming...")
-            final_video = final_video.subclip(0, MAX_DURATION)
-            final_video = final_video.fadeout(0.2) # Quick fade if trimmed
+        # 1 second fade out for a smooth ending
+        fade = 1.0
+        duration = total_duration
+        if duration > MAX_DURATION:
+            logging.warning(f"⚠️ Video duration {duration}s exceeds {MAX_DURATION}s. Trimming...")
+            duration = MAX_DURATION
+            fade = 0.2 # Quick fade if trimmed
         
         # Write final video
         logging.info(f"   📹 Rendering cosmic video to {output_path}...")
-        final_video.write_videofile(
-            output_path, 
-            fps=30, 
-            codec="libx264", 
-            audio_codec="aac",
-            threads=4,
-            preset="medium"
-        )
+        stem = os.path.splitext(os.path.basename(output_path))[0]
+        fps = 30
+        
+        # Frame ranges on the shared timeline: rounding cumulative times (not each
+        # scene on its own) keeps the concatenated video in sync with the audio
+        bounds, t = [0], 0.0
+        for clip in scenes:
+            t += clip.duration
+            bounds.append(min(round(t * fps), round(duration * fps)))
+        
+        # Each scene becomes its own H.264 file (encoded concurrently); fades run in
+        # ffmpeg's filter graph, and the video fade stays inside the last scene
+        jobs = []
+        for i, clip in enumerate(scenes):
+            n_frames = bounds[i + 1] - bounds[i]
+            if n_frames <= 0:
+                continue
+            jobs.append([clip, os.path.join("assets", "temp", f"{stem}_scene_{i:02d}.mp4"), n_frames, []])
+        if not jobs:
+            logging.error("Nothing to encode: scenes have no frames.")
+            return
+        last_len = jobs[-1][2] / fps
+        fade = min(fade, last_len)
+        jobs[-1][3].append(f"fade=t=out:st={last_len - fade:.3f}:d={fade}")
+        
+        def encode(job):
+            clip, path, n_frames, filters = job
+            prepared = getattr(clip, "prepared_encode", None)
+            if prepared:
+                try:
+                    prepared[0].result()
+                    # Reuse the encode started right after capture when it covers exactly this job
+                    if not filters and prepared[2] == n_frames:
+                        return prepared[1]
+                    # Trim/fade: the raw frames are released by now, so work from the encoded file
+                    self._reencode_scene_file(prepared[1], path, n_frames, filters)
+                    return path
+                except Exception as e:
+                    # Raw frames are only kept when the pre-encode itself failed; once they
+                    # are released (or the scene came from the cache) there is nothing left
+                    # to encode from
+                    store = getattr(clip, "frame_store", None)
+                    if not store or store[0] is None:
+                        raise RuntimeError(f"Scene encode failed and its raw frames are gone: {e}") from e
+                    logging.warning(f"   ⚠️ Pre-encoded scene unusable ({e}). Re-encoding.")
+            self._encode_scene_video(clip, path, n_frames, filters, fps=fps)
+            return path
+        
+        scene_paths = []
+        try:
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                scene_paths = list(ex.map(encode, jobs))
+            
+            audio = final_audio.subclip(0, duration) if final_audio is not None else None
+            self._mux_final(scene_paths, audio, output_path, [f"afade=t=out:st={max(0.0, duration - fade):.3f}:d={fade}"])
+        finally:
+            leftovers = set(scene_paths)
+            for clip in scenes:
+                prepared = getattr(clip, "prepared_encode", None)
+                if prepared:
+                    # Let unused pre-encodes (last/trimmed scenes) finish before deleting them
+                    prepared[0].exception()
+                    leftovers.add(prepared[1])
+            for path in leftovers:
+                if os.path.exists(path):
+                    os.remove(path)
         logging.info(f"   ✅ Cosmic video saved: {output_path}")
 
+    def _encode_scene_video(self, clip, output_path: str, n_frames: int, video_filters: list = None, fps: int = 30):
+        """
+        Encodes one scene (video only) by streaming its raw RGB frames straight into ffmpeg.
+        Frames come from the in-memory scene arrays, so nothing is re-decoded on the way;
+        low-res captures are upscaled to full HD here.
+        """
+        encoder = self._best_encoder
+        width, height = clip.size
+        
+        filters = list(video_filters or [])
+        if (width, height) != (self.width, self.height):
+            filters.append(f"scale={self.width}:{self.height}:flags=lanczos")
+        
+        cmd = [
+            _ffmpeg_binary(), "-y", "-loglevel", "error", *encoder.get("init", []),
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+            *_encoder_args(encoder, filters), output_path,
+        ]
+        
+        # Array-backed scenes are indexed directly; a float time round-trip could land
+        # on the neighbouring frame. Other clips (file readers) round k / fps themselves.
+        store = getattr(clip, "frame_store", None)
+        frames = store[0] if store else None
+        if frames is not None:
+            last = len(frames) - 1
+            frame_at = lambda k: frames[min(k, last)]
+        else:
+            frame_at = lambda k: clip.get_frame(k / fps)
+        
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for k in range(n_frames):
+                proc.stdin.write(np.ascontiguousarray(frame_at(k), dtype=np.uint8).data)
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its stderr below says why
+        finally:
+            proc.stdin.close()
+            err = proc.stderr.read().decode("utf-8", "replace")
+            proc.wait()
+        
+        if proc.returncode != 0:
+            raise Exception(f"ffmpeg scene encode failed ({proc.returncode}): {err.strip()[-500:]}")
+
+    def _reencode_scene_file(self, source_path: str, output_path: str, n_frames: int, video_filters: list = None):
+        """
+        Re-encodes the first n_frames of an already encoded scene with extra filters
+        (the last scene's trim and fade-out). Used once a scene's raw frames are gone.
+        """
+        encoder = self._best_encoder
+        cmd = [
+            _ffmpeg_binary(), "-y", "-loglevel", "error", *encoder.get("init", []),
+            "-i", source_path, "-frames:v", str(n_frames),
+            *_encoder_args(encoder, video_filters), output_path,
+        ]
+        
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0:
+            err = result.stderr.decode("utf-8", "replace")
+            raise Exception(f"ffmpeg scene re-encode failed ({result.returncode}): {err.strip()[-500:]}")
+
+    def _mux_final(self, scene_paths: list, audio, output_path: str, audio_filters: list = None):
+        """
+        Joins the per-scene files with ffmpeg's concat demuxer (video stream copied, no
+        re-encode) and muxes in the mixed audio track, streamed as raw PCM over stdin so
+        it is encoded to AAC exactly once and never touches disk.
+        """
+        stem = os.path.splitext(os.path.basename(output_path))[0]
+        list_path = os.path.join("assets", "temp", f"{stem}_scenes.txt")
+        
+        with open(list_path, "w", encoding="utf-8") as f:
+            for path in scene_paths:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        
+        cmd = [_ffmpeg_binary(), "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path]
+        if audio is not None:
+            cmd += ["-f", "f32le", "-ar", str(MUSIC_FPS), "-ac", str(audio.nchannels), "-i", "pipe:0",
+                    "-map", "0:v", "-map", "1:a", "-shortest", "-c:a", "aac", "-b:a", "192k"]
+            if audio_filters:
+                cmd += ["-af", ",".join(audio_filters)]
+        cmd += ["-c:v", "copy", output_path]
+        
+        try:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE if audio is not None else subprocess.DEVNULL, stderr=subprocess.PIPE)
+            try:
+                if audio is not None:
+                    for chunk in audio.iter_chunks(fps=MUSIC_FPS, chunksize=MUSIC_FPS, quantize=False):
+                        proc.stdin.write(np.ascontiguousarray(chunk, dtype="<f4").data)
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its stderr below says why
+            finally:
+                if proc.stdin:
+                    proc.stdin.close()
+                err = proc.stderr.read().decode("utf-8", "replace")
+                proc.wait()
+            if proc.returncode != 0:
+                raise Exception(f"ffmpeg concat failed ({proc.returncode}): {err.strip()[-500:]}")
+        finally:
+            if os.path.exists(list_path):
+                os.remove(list_path)
+
+    def _music_clip(self, music_path: str, duration: float):
+        """
+        Background bed of `duration` seconds at background volume. Each track is decoded
+        once per engine and kept as float32 PCM, so later videos just slice (or tile) it.
+        """
+        pcm = self._music_pcm.get(music_path)
+        if pcm is None:
+            baked_path = self._baked_music_path(music_path)
+            if os.path.exists(baked_path) or self._bake_music(music_path, baked_path):
+                # Already looped and at background volume
+                src = AudioFileClip(baked_path)
+                pcm = src.to_soundarray(fps=MUSIC_FPS).astype(np.float32)
+            else:
+                src = AudioFileClip(music_path)
+                # Lower content volume significantly (background)
+                pcm = (src.to_soundarray(fps=MUSIC_FPS) * MUSIC_VOLUME).astype(np.float32)
+            src.close()
+            self._music_pcm[music_path] = pcm
+        
+        n = int(round(duration * MUSIC_FPS))
+        if len(pcm) < n:
+            # Loop music if shorter than video
+            pcm = np.tile(pcm, (-(-n // len(pcm)), 1))
+        return AudioArrayClip(pcm[:n], fps=MUSIC_FPS)
+
+    def _baked_music_path(self, music_path: str) -> str:
+        """Cache location of the pre-rendered background bed for a source track."""
+        stem = os.path.splitext(os.path.basename(music_path))[0]
+        return os.path.join(self.music_cache_dir, f"{stem}_{int(MAX_DURATION)}s.m4a")
+
+    def _bake_music(self, music_path: str, baked_path: str) -> bool:
+        """
+        Renders one track as a ready-to-mix bed: looped out to MAX_DURATION with the
+        background volume applied, so assemble_final only has to load and cut it.
+        """
+        os.makedirs(self.music_cache_dir, exist_ok=True)
+        tmp_path = baked_path + ".tmp.m4a"
+        cmd = [
+            _ffmpeg_binary(), "-y", "-loglevel", "error",
+            "-stream_loop", "-1", "-i", music_path, "-t", str(MAX_DURATION),
+            "-filter:a", f"volume={MUSIC_VOLUME}", "-vn", "-c:a", "aac", "-b:a", "128k", tmp_path,
+        ]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, timeout=120)
+            os.replace(tmp_path, baked_path)
+            return True
+        except Exception as e:
+            logging.warning(f"   ⚠️ Could not pre-render music {os.path.basename(music_path)}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def _precompute_music_cache(self):
+        """Bakes a background bed for every local track that doesn't have a fresh one yet."""
+        for src in self._music_index["all"]:
+            baked = self._baked_music_path(src)
+            if os.path.exists(baked) and os.path.getmtime(baked) >= os.path.getmtime(src):
+                continue
+            logging.info(f"   🎵 Pre-rendering background bed for {os.path.basename(src)}...")
+            self._bake_music(src, baked)
+
+    def _build_music_index(self):
+        """Scans the music folder once and buckets tracks by the mood tags in their filenames."""
+        self._music_index = defaultdict(list)
+        if not os.path.isdir(self.music_folder):
+            return
+        for f in sorted(os.listdir(self.music_folder)):
+            if not f.endswith(('.mp3', '.wav', '.m4a')):
+                continue
+            path = os.path.join(self.music_folder, f)
+            self._music_index["all"].append(path)
+            for tag in MUSIC_MOOD_TAGS:
+                if tag in f.lower():
+                    self._music_index[tag].append(path)
+
     def _select_music_by_mood(self, mood: str, sign_name: str = None) -> str:
         """Selects background music based on mood and sign."""
         import random
         
-        base_music_folder = os.path.join("assets", "music")
-        
         # 1. SKIP Sign-Specific Music Folder (Contains Vedic/Chanting tracks which are not fit for Western style)
         # target_list = []
         # if sign_name:
         #     sign_key = self._get_sign_key(sign_name) 
-        #     sign_music_base = os.path.join(base_music_folder, "music")
+        #     sign_music_base = os.path.join(self.music_folder, "music")
         #     if os.path.exists(sign_music_base) and os.path.isdir(sign_music_base):
         #         try:
         #             music_subdirs = [d for d in os.listdir(sign_music_base) 
@@ -559,28 +1575,21 @@ class EditorEngine:
         #             logging.warning(f"   ⚠️ Could not access sign music folder: {e}")
 
         # 2. Always use Generic Western/Cosmic Music
-        target_list = [] # Reset to ensure we use generic
-        if not target_list:
-            if not os.path.exists(base_music_folder):
-                os.makedirs(base_music_folder, exist_ok=True)
-                self._ensure_music_assets(base_music_folder)
-            
-            all_music = [f for f in os.listdir(base_music_folder) if f.endswith(('.mp3', '.wav', '.m4a'))]
-            if not all_music:
-                self._ensure_music_assets(base_music_folder)
-                all_music = [f for f in os.listdir(base_music_folder) if f.endswith(('.mp3', '.wav', '.m4a'))]
-            
-            if not all_music: return None
-            
-            # Filter by mood
-            mood_lower = mood.lower()
-            matching_music = [f for f in all_music if mood_lower in f.lower()]
-            
-            if not matching_music:
-                if "energetic" in mood_lower: matching_music = [f for f in all_music if "upbeat" in f.lower()]
-                elif "peaceful" in mood_lower: matching_music = [f for f in all_music if "ambient" in f.lower()]
-            
-            target_list = [os.path.join(base_music_folder, f) for f in (matching_music if matching_music else all_music)]
+        if not self._music_index["all"]:
+            self._ensure_music_assets(self.music_folder)
+        
+        all_music = self._music_index["all"]
+        if not all_music: return None
+        
+        # Filter by mood
+        mood_lower = mood.lower()
+        matching_music = self._music_index.get(mood_lower) or [p for p in all_music if mood_lower in os.path.basename(p).lower()]
+        
+        if not matching_music:
+            if "energetic" in mood_lower: matching_music = self._music_index.get("upbeat")
+            elif "peaceful" in mood_lower: matching_music = self._music_index.get("ambient")
+        
+        target_list = matching_music if matching_music else all_music
 
         return random.choice(target_list)
 
@@ -591,19 +1600,35 @@ class EditorEngine:
             "energetic_upbeat.mp3": "https://incompetech.com/music/royalty-free/mp3-royaltyfree/Life%20of%20Riley.mp3",
             "mysterious_deep.mp3": "https://incompetech.com/music/royalty-free/mp3-royaltyfree/Private%20Reflection.mp3"
         }
+        os.makedirs(music_folder, exist_ok=True)
+        missing = [(f, u) for f, u in tracks.items() if not os.path.exists(os.path.join(music_folder, f))]
+        if missing:
+            try:
+                import requests
+            except ImportError as e:
+                logging.warning(f"   ⚠️ Could not download music: {e}")
+                return
+            # Network-bound: fetch all tracks at once over one pooled session
+            # (all tracks share a host, so the TLS connections are reused)
+            with requests.Session() as session, ThreadPoolExecutor(max_workers=len(missing)) as ex:
+                list(ex.map(lambda item: self._download_track(session, music_folder, *item), missing))
+        
+        # Pick up whatever arrived
+        self._build_music_index()
+
+    @staticmethod
+    def _download_track(session, music_folder: str, filename: str, url: str):
+        """Streams one track to disk in 1 MiB chunks; a partial file never lands under its real name."""
+        path = os.path.join(music_folder, filename)
+        tmp_path = path + ".part"
         try:
-            import requests
-            for f, u in tracks.items():
-                p = os.path.join(music_folder, f)
-                if not os.path.exists(p):
-                    logging.info(f"   ⬇️ Fetching {f}...")
-                    r = requests.get(u, verify=False, timeout=30)
-                    with open(p, 'wb') as file: file.write(r.content)
+            logging.info(f"   ⬇️ Fetching {filename}...")
+            with session.get(url, stream=True, timeout=30) as r, open(tmp_path, 'wb') as f:
+                r.raise_for_status()
+                r.raw.decode_content = True  # honour gzip/deflate transfer encodings
+                shutil.copyfileobj(r.raw, f, length=1 << 20)
+            os.replace(tmp_path, path)
         except Exception as e:
-            logging.warning(f"   ⚠️ Could not download music: {e}")
-
-
-# Helper for concatenate
-def run_concatenate(clips):
-    from moviepy.editor import concatenate_videoclips
-    return concatenate_videoclips(clips, method="compose")
+            logging.warning(f"   ⚠️ Could not download music {filename}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -1,19 +1,31 @@
 import os
 import sys
 import argparse
+import asyncio
 import json
+import hashlib
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
 import re
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from agents.astrologer import AstrologerAgent
 from agents.director import DirectorAgent
 from agents.narrator import NarratorAgent
 from agents.uploader import YouTubeUploader
+from core import llm_cache
 from editor import EditorEngine
 from moviepy.editor import AudioFileClip
 
+# Try to import orjson (faster subtitle parsing; stdlib json otherwise)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure Logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 
@@ -23,6 +35,10 @@ ZODIAC_SIGNS = [
     "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
 ]
 
+# Scheduling timezones (US Eastern audience; YouTube API wants UTC)
+_EST = pytz.timezone('America/New_York')
+_UTC = pytz.utc
+
 # Sign Index for scheduling (1-12)
 SIGN_INDEX_MAP = {
     "aries": 1, "taurus": 2, "gemini": 3, "cancer": 4,
@@ -30,8 +46,153 @@ SIGN_INDEX_MAP = {
     "sagittarius": 9, "capricorn": 10, "aquarius": 11, "pisces": 12
 }
 
+# Emotion tags the narrator understands, e.g. "(Happy)"; stripped from display text
+_EMOTION_TAG_RE = re.compile(r'\s*\((?:Happy|Excited|Serious|Caution|Warm)\)\s*', re.IGNORECASE)
+
+# Max concurrent TTS requests per video (keeps us under Edge-TTS rate limits)
+TTS_MAX_WORKERS = 8
+
+# Max section scenes handed to the editor at once while TTS is still running
+RENDER_MAX_WORKERS = 3
+
+
+def _probe_duration(path):
+    """Reads an MP3's duration from its header (no ffmpeg decode)."""
+    from mutagen.mp3 import MP3
+    return MP3(path).info.length
+
+
+def _load_subtitles(path):
+    """Reads a narrator word-timing JSON file; None if missing or unreadable."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except Exception:
+        return None
+
+
+def _discard_scene(future):
+    """
+    Waits for the render of a trimmed section, then frees what it produced:
+    the clip and its early-encode temp file (assets/temp/scene_*.mp4).
+    """
+    if future.cancelled() or future.exception():
+        return
+    clip = future.result()
+    if not clip:
+        return
+    prepared = getattr(clip, "prepared_encode", None)
+    if prepared:
+        prepared[0].exception()  # wait for the encode to finish writing
+        if os.path.exists(prepared[1]):
+            os.remove(prepared[1])
+    clip.close()
+
+
+# Agent constructors, keyed by the names used throughout the pipeline
+_AGENT_FACTORIES = {
+    'astrologer': AstrologerAgent,
+    'director': DirectorAgent,
+    'narrator': NarratorAgent,
+    'editor': EditorEngine,
+    'uploader': YouTubeUploader,
+}
+
+
+class LazyAgents(dict):
+    """Agents dict that constructs each agent on first access."""
+    
+    def __missing__(self, name):
+        agent = self[name] = _AGENT_FACTORIES[name]()
+        return agent
+
+
+def _cached_screenplay(director, script):
+    """
+    Returns director.create_screenplay(script), reusing a cached copy when the
+    same script was analyzed recently (mood is deterministic w.r.t. the script,
+    so re-runs skip the LLM call). The Director's hardcoded fallback is never
+    cached, so a transient outage doesn't pin a script to placeholder visuals.
+    """
+    key = hashlib.sha256(json.dumps(script, sort_keys=True, default=str).encode()).hexdigest()
+    screenplay = llm_cache.get(key, prefix="screenplay")
+    if screenplay is not None:
+        print("   ♻️ Using cached screenplay.")
+        return screenplay
+    
+    screenplay = director.create_screenplay(script)
+    if isinstance(screenplay, dict) and not screenplay.get("fallback"):
+        llm_cache.set(key, screenplay, prefix="screenplay")
+    return screenplay
+
+
+def _intro_scene(editor, sign, theme_override, period_type, intro_text):
+    """
+    The "Find Your Sign" intro only varies by sign, theme and period, so its
+    encoded clip is cached and reused by every later video with the same inputs.
+    """
+    header = "Find Your Sign"
+    clean_sign = sign.split('(')[0].strip().split()[0]
+    # Copy changes must miss the cache, so the on-screen text is part of the key
+    copy_hash = hashlib.sha256(f"{header}\n{intro_text}".encode()).hexdigest()[:12]
+    key = f"{clean_sign}_{theme_override or 'def'}_{period_type}_intro_{copy_hash}"
+    
+    clip = editor.load_cached_scene(key)
+    if clip:
+        return clip
+    
+    clip = editor.create_scene(sign, intro_text, 4.0, None, theme_override, header, period_type)
+    if clip:
+        editor.store_cached_scene(key, clip)
+    return clip
+
 
-def process_immediate_upload(agents, video_path, script_data, sign, date_str, period_type):
+def _generate_upload_metadata(uploader, astrologer, script_data, sign, date_str, period_type, skip_meta=False):
+    """
+    Returns upload metadata: cached or freshly generated viral metadata, else the simple fallback.
+    skip_meta goes straight to the simple (no-LLM) metadata.
+    """
+    if skip_meta:
+        print("⏭️ Viral metadata disabled (--no-meta). Using simple metadata.")
+        return uploader.generate_metadata(sign, date_str, period_type)
+    
+    try:
+        # ALWAYS try to generate Mega Viral Metadata (300+ keywords) via Astrologer
+        # Same (sign, date, period, script) always yields reusable metadata,
+        # so retries and re-runs skip the LLM round-trip.
+        cache_key = None
+        meta = None
+        if script_data is not None:
+            cache_key = hashlib.sha256(json.dumps(
+                {"sign": sign, "date": date_str, "p": period_type, "s": script_data},
+                sort_keys=True, default=str
+            ).encode()).hexdigest()
+            meta = llm_cache.get(cache_key)
+        
+        if meta and "title" in meta:
+            print("♻️ Using cached MEGA Metadata.")
+        else:
+            print("🚀 Generating MEGA Viral Metadata (300+ keywords)...")
+            meta = astrologer.generate_viral_metadata(sign, date_str, period_type, script_data)
+            
+            if not meta or "title" not in meta:
+                print("⚠️ Advanced metadata generation failed. Falling back to simple...")
+                meta = uploader.generate_metadata(sign, date_str, period_type)
+            else:
+                print("✅ MEGA Metadata Generated Successfully!")
+                if cache_key:
+                    llm_cache.set(cache_key, meta)
+            
+    except Exception as e:
+        print(f"⚠️ Metadata extraction failed: {e}. Using fallback.")
+        meta = uploader.generate_metadata(sign, date_str, period_type)
+    return meta
+
+
+async def process_immediate_upload(agents, video_path, script_data, sign, date_str, period_type, skip_meta=False):
     """
     Handles immediate upload logic with smart scheduling check.
     If past 6 AM EST, uploads PUBLIC immediately.
@@ -44,14 +205,8 @@ def process_immediate_upload(agents, video_path, script_data, sign, date_str, pe
          print("❌ Upload skipped: No Auth.")
          return
 
-    if not os.path.exists(video_path):
-        print(f"❌ Video file not found for upload: {video_path}")
-        return
-
     # Scheduling Logic (EST)
-    from datetime import timedelta
-    est = pytz.timezone('America/New_York')
-    now_est = datetime.now(est)
+    now_est = datetime.now(_EST)
     
     # Target: 6:00 AM EST Today
     target_time = now_est.replace(hour=6, minute=0, second=0, microsecond=0)
@@ -63,12 +218,11 @@ def process_immediate_upload(agents, video_path, script_data, sign, date_str, pe
     cutoff_time = now_est.replace(hour=5, minute=0, second=0, microsecond=0)
     if now_est < cutoff_time:
         # Add random delay (0-45 mins) for organic feel
-        import random
         delay_minutes = random.randint(0, 45) 
         target_time = target_time + timedelta(minutes=delay_minutes)
         
         # Convert to UTC for API
-        target_utc = target_time.astimezone(pytz.utc)
+        target_utc = target_time.astimezone(_UTC)
         publish_at = target_utc.replace(tzinfo=None)
         privacy_status = "private" # Must be private for scheduled
         print(f"   📅 Early Morning! Scheduled for: {target_time.strftime('%H:%M')} EST (Delay: {delay_minutes}m)")
@@ -79,38 +233,36 @@ def process_immediate_upload(agents, video_path, script_data, sign, date_str, pe
         publish_at = None
 
     print(f"\n🚀 Initiating Upload for {period_type}...")
-    try:
-        # ALWAYS try to generate Mega Viral Metadata (300+ keywords) via Astrologer
-        print("🚀 Generating MEGA Viral Metadata (300+ keywords)...")
-        meta = astrologer.generate_viral_metadata(sign, date_str, period_type, script_data)
-        
-        if not meta or "title" not in meta:
-            print("⚠️ Advanced metadata generation failed. Falling back to simple...")
-            meta = uploader.generate_metadata(sign, date_str, period_type)
-        else:
-            print("✅ MEGA Metadata Generated Successfully!")
-            
-    except Exception as e:
-        print(f"⚠️ Metadata extraction failed: {e}. Using fallback.")
-        meta = uploader.generate_metadata(sign, date_str, period_type)
+    # Metadata (LLM, seconds) and upload preflight (file stat + chunked media
+    # setup) are independent, so run them side by side.
+    meta, media = await asyncio.gather(
+        asyncio.to_thread(_generate_upload_metadata, uploader, astrologer, script_data, sign, date_str, period_type, skip_meta),
+        asyncio.to_thread(uploader.prepare_media, video_path),
+    )
     
     if "categoryId" not in meta: meta["categoryId"] = "24"
     
     # Ensure tags is a list (LLM sometimes returns comma-separated string)
-    if isinstance(meta.get("tags"), str):
-        meta["tags"] = [t.strip() for t in meta["tags"].split(",")]
+    raw_tags = meta.get("tags")
+    if isinstance(raw_tags, str):
+        raw_tags = raw_tags.split(",")
+    elif not isinstance(raw_tags, list):
+        raw_tags = []
     
-    # Pre-sanitize tags: strip # prefixes, <, >, filter empties
-    if isinstance(meta.get("tags"), list):
-        clean_tags = []
-        for t in meta["tags"]:
-            if isinstance(t, str):
-                t = t.replace("#", "").replace("<", "").replace(">", "").strip()
-                if t and len(t) >= 2:
-                    clean_tags.append(t[:30])
-        meta["tags"] = clean_tags if clean_tags else ["horoscope", "astrology", "zodiac", "shorts"]
+    # Pre-sanitize tags: strip # prefixes, <, >, filter empties, dedupe (order-preserving)
+    clean_tags = dict.fromkeys(
+        t[:30] for t in (
+            r.replace("#", "").replace("<", "").replace(">", "").strip()
+            for r in raw_tags if isinstance(r, str)
+        ) if len(t) >= 2
+    )
+    # (Count/length limits are enforced in one place: YouTubeUploader._sanitize_tags)
+    meta["tags"] = list(clean_tags) or ["horoscope", "astrology", "zodiac", "shorts"]
     
-    upload_success = uploader.upload_video(video_path, meta, privacy_status=privacy_status, publish_at=publish_at)
+    upload_success = await asyncio.to_thread(
+        uploader.upload_video, video_path, meta,
+        privacy_status=privacy_status, publish_at=publish_at, media=media
+    )
     
     if not upload_success:
         raise Exception(f"❌ YouTube upload FAILED for {sign} ({period_type}). Check logs above for details.")
@@ -122,10 +274,12 @@ def produce_video_from_script(agents, sign, title_suffix, script, date_str, them
     """
     Orchestrates the production of a single video from a script.
     Uses gradient sign-themed backgrounds with karaoke text.
+    Returns the path of the finished video (raises if it wasn't written).
     """
     narrator, editor, director = agents['narrator'], agents['editor'], agents['director']
     
     print(f"\n🎬 STARTING PRODUCTION: {title_suffix} ({header_text})...")
+    sign_file = sign.split()[0]  # Output filename prefix
 
 
     scenes = []
@@ -144,21 +298,25 @@ def produce_video_from_script(agents, sign, title_suffix, script, date_str, them
     
     # Use Director to analyze script and get mood for music
     print(f"   🎬 Director analyzing content mood...")
-    screenplay = director.create_screenplay(script)
+    screenplay = _cached_screenplay(director, script)
     content_mood = screenplay.get("mood", "peaceful") if isinstance(screenplay, dict) else "peaceful"
     print(f"   🎵 Detected mood: {content_mood}")
     
     # Define order of sections to ensure flow
     priority_order = ["hook", "intro", "love", "career", "money", "health", "advice", "lucky_color", "lucky_number", "best_time", "key_dates", "affirmation"]
     
-    # Identify relevant sections from script
+    # Identify relevant sections from script (metadata is never narrated)
+    priority_set = set(priority_order)
+    tail = [k for k in script if k not in priority_set and k != "metadata"]
     active_sections = []
-    for section in priority_order + [k for k in script.keys() if k not in priority_order]:
-        if section in script and script[section] and len(str(script[section])) >= 5:
-            # Skip metadata section
-            if section == "metadata":
-                continue
-            active_sections.append(section)
+    for section in (*priority_order, *tail):
+        val = script.get(section)
+        if not val:
+            continue
+        sval = val if isinstance(val, str) else str(val)
+        if len(sval) < 5:
+            continue
+        active_sections.append(section)
 
     print(f"   📋 Processing {len(active_sections)} active sections...")
     
@@ -166,9 +324,11 @@ def produce_video_from_script(agents, sign, title_suffix, script, date_str, them
     section_audios = {}
     total_duration = 0.0
     
-    os.makedirs(f"assets/temp/{title_suffix}", exist_ok=True)
+    temp_dir = f"assets/temp/{title_suffix}"
+    os.makedirs(temp_dir, exist_ok=True)
     
-    for section in active_sections:
+    def _synthesize_section(section):
+        """Runs TTS for one section. Returns (section, data) or None on failure."""
         original_text = str(script[section])
         
         # Clean text for display and speech
@@ -176,7 +336,7 @@ def produce_video_from_script(agents, sign, title_suffix, script, date_str, them
         
         # Remove emotion tags from display text only (Narrator handles speech text cleaning internally)
         # Using regex to remove (Happy), (Excited), etc. and any extra spaces
-        display_text = re.sub(r'\s*\((Happy|Excited|Serious|Caution|Warm)\)\s*', ' ', original_text, flags=re.IGNORECASE).strip()
+        display_text = _EMOTION_TAG_RE.sub(' ', original_text).strip()
         
         # Format section-specific content
         if section == "lucky_color":
@@ -193,30 +353,72 @@ def produce_video_from_script(agents, sign, title_suffix, script, date_str, them
         text_stripped = speech_text.strip()
         if (text_stripped.startswith("{") and "}" in text_stripped) or (text_stripped.startswith("[") and "]" in text_stripped):
             print(f"         ⚠️ WARNING: Section '{section}' appears to be a raw object. Skipping.")
-            continue
+            return None
              
-        audio_path = f"assets/temp/{title_suffix}/{section}.mp3"
+        audio_path = f"{temp_dir}/{section}.mp3"
         subtitle_path = audio_path.replace(".mp3", ".json")
         
         narrator.speak(speech_text, audio_path)
         
-        if os.path.exists(audio_path):
+        if not os.path.exists(audio_path):
+            print(f"         ⚠️ Generation failed for {section}")
+            return None
+        
+        try:
+            dur = _probe_duration(audio_path) + 0.3  # Buffer
+            data = {
+                "path": audio_path,
+                "duration": dur,
+                "subtitle_path": subtitle_path,
+                "text": display_text,
+            }
+            return section, data
+        except Exception as e:
+            print(f"         ⚠️ Audio read error for {section}: {e}")
+            return None
+    
+    clean_sign_name = sign.split('(', 1)[0].strip()
+    
+    def _render_section(data):
+        """Renders one section scene once its narration and subtitles are on disk."""
+        # Load subtitles
+        subtitle_data = _load_subtitles(data["subtitle_path"])
+        
+        return editor.create_scene(
+            clean_sign_name, data["text"], data["duration"], subtitle_data,
+            theme_override, header_text, period_type
+        )
+    
+    # TTS calls are network-bound and independent, so run them concurrently.
+    # Capped to stay clear of TTS rate limits; one extra worker renders the
+    # "Find Your Sign" intro, whose inputs are already known, alongside them.
+    # Each section's scene render is kicked off as soon as its TTS finishes,
+    # on a smaller pool so the ffmpeg-heavy renders don't thrash.
+    executor = ThreadPoolExecutor(max_workers=min(TTS_MAX_WORKERS, len(active_sections)) + 1)
+    render_pool = ThreadPoolExecutor(max_workers=RENDER_MAX_WORKERS)
+    scene_futures = {}
+    try:
+        # NEW: Add "Find Your Sign" Intro Scene for Western Astrology context
+        intro_text = "Unsure of your Sign? Check the Description below! ⬇️"
+        intro_future = executor.submit(_intro_scene, editor, sign, theme_override, period_type, intro_text)
+        
+        futures = [executor.submit(_synthesize_section, section) for section in active_sections]
+        for future in as_completed(futures):
             try:
-                clip = AudioFileClip(audio_path)
-                dur = clip.duration + 0.3  # Buffer
-                section_audios[section] = {
-                    "path": audio_path,
-                    "duration": dur,
-                    "subtitle_path": subtitle_path,
-                    "text": display_text,
-                    "audio_object": clip 
-                }
-                clip.close()
-                total_duration += dur
+                result = future.result()
             except Exception as e:
-                print(f"         ⚠️ Audio read error for {section}: {e}")
-        else:
-            print(f"         ⚠️ Generation failed for {section}")
+                print(f"         ⚠️ TTS error: {e}")
+                continue
+            if result:
+                section, data = result
+                section_audios[section] = data
+                total_duration += data["duration"]
+                scene_futures[section] = render_pool.submit(_render_section, data)
+    finally:
+        # Don't wait here: the intro and section renders keep running while we
+        # trim; their results are collected in Phase 3.
+        executor.shutdown(wait=False)
+        render_pool.shutdown(wait=False)
 
     print(f"   ⏱️  Total Pre-Render Duration: {total_duration:.2f}s")
 
@@ -226,102 +428,103 @@ def produce_video_from_script(agents, sign, title_suffix, script, date_str, them
     else:
         TARGET_DURATION = 600.0  # 10 mins for Monthly/Yearly
 
+    dropped_renders = []
     if total_duration > TARGET_DURATION:
         print(f"   ⚠️ Duration {total_duration:.2f}s > {TARGET_DURATION}s. Initiating SMART TRIMMING.")
         
         # Strategy: Drop sections in order of "least impact"
         drop_candidates = ["intro", "health", "lucky_number", "lucky_color", "best_time", "money"]
         
+        # Pick the drop set in one greedy pass over the candidates
+        excess = total_duration - TARGET_DURATION
+        dropped = []
         for candidate in drop_candidates:
-            if total_duration <= TARGET_DURATION:
+            if excess <= 0:
                 break
-            
             if candidate in section_audios:
-                dropped_dur = section_audios[candidate]["duration"]
-                print(f"      ✂️ Dropping '{candidate.upper()}' (-{dropped_dur:.2f}s)")
-                del section_audios[candidate]
-                if candidate in active_sections:
-                    active_sections.remove(candidate)
-                total_duration -= dropped_dur
+                dropped.append(candidate)
+                excess -= section_audios[candidate]["duration"]
+        
+        for candidate in dropped:
+            dropped_dur = section_audios.pop(candidate)["duration"]
+            print(f"      ✂️ Dropping '{candidate.upper()}' (-{dropped_dur:.2f}s)")
+            total_duration -= dropped_dur
+            # Its render may already be underway; cancel it, or discard it before assembly
+            dropped_future = scene_futures.pop(candidate, None)
+            if dropped_future and not dropped_future.cancel():
+                dropped_renders.append(dropped_future)
+        dropped_set = set(dropped)
+        active_sections = [s for s in active_sections if s not in dropped_set]
                 
         print(f"   ✅ New Duration: {total_duration:.2f}s")
     
-    # --- PHASE 3: CREATE SCENES ---
+    # --- PHASE 3: COLLECT SCENES ---
+    rendered_sections = [s for s in active_sections if s in section_audios]
+    print(f"   📍 Collecting {len(rendered_sections)} Section Scenes...")
     
-    # NEW: Add "Find Your Sign" Intro Scene for Western Astrology context
-    print("   📍 Rendering Intro Scene...")
     try:
-        intro_text = "Unsure of your Sign? Check the Description below! ⬇️"
-        # Use a neutral header or the standard one
-        intro_clip = editor.create_scene(
-            sign, 
-            intro_text, 
-            duration=4.0, 
-            theme_override=theme_override, 
-            header_text="Find Your Sign",
-            period_type=period_type
-        )
-        if intro_clip:
-            scenes.append(intro_clip)
-            print("      ✅ Intro scene added.")
+        intro_clip = intro_future.result()
     except Exception as e:
-        print(f"      ⚠️ Failed to add intro scene: {e}")
+        print(f"      ⚠️ Intro render error: {e}")
+        intro_clip = None
+    if intro_clip:
+        scenes.append(intro_clip)
+        print("      ✅ Intro scene added.")
+    else:
+        print("      ⚠️ Failed to add intro scene.")
 
-    for section in active_sections:
-        if section not in section_audios:
-            continue
-            
-        data = section_audios[section]
-        audio_path = data["path"]
-        duration = data["duration"]
-        subtitle_path = data["subtitle_path"]
-        text = data["text"]
-        
-        print(f"\n   📍 Rendering Scene: {section.upper()} ({duration:.1f}s)")
-        
-        # Load subtitles
-        subtitle_data = None
-        if os.path.exists(subtitle_path):
-            try:
-                with open(subtitle_path, 'r', encoding='utf-8') as f:
-                    subtitle_data = json.load(f)
-            except: pass
-            
-        # Create Scene
-        clean_sign_name = sign.split('(')[0].strip() if '(' in sign else sign
-        clip = editor.create_scene(
-            clean_sign_name, 
-            text, 
-            duration, 
-            subtitle_data=subtitle_data, 
-            theme_override=theme_override,
-            header_text=header_text,
-            period_type=period_type
-        )
+    # Each narration file is opened once here (durations came from mutagen);
+    # readers are closed once the final master is written, even on failure.
+    audio_clips = []
+    try:
+        for section in rendered_sections:
+            data = section_audios[section]
+            print(f"\n   📍 Scene: {section.upper()} ({data['duration']:.1f}s)")
         
-        # Attach Audio
-        if clip:
             try:
-                audio_clip = AudioFileClip(audio_path)
-                clip = clip.set_audio(audio_clip)
-                scenes.append(clip)
-                print(f"      ✅ Scene ready.")
+                clip = scene_futures[section].result()
             except Exception as e:
-                print(f"      ❌ Audio attach error: {e}")
-        else:
-             print(f"      ❌ Scene render failed.")
+                print(f"      ❌ Scene render error: {e}")
+                clip = None
         
-    if not scenes:
-        print("❌ No scenes created.")
-        raise Exception("No scenes created.")
+            # Attach Audio
+            if clip:
+                try:
+                    audio_clip = AudioFileClip(data["path"])
+                    audio_clips.append(audio_clip)
+                    clip = clip.set_audio(audio_clip)
+                    scenes.append(clip)
+                    print(f"      ✅ Scene ready.")
+                except Exception as e:
+                    print(f"      ❌ Audio attach error: {e}")
+            else:
+                 print(f"      ❌ Scene render failed.")
+        
+        # Trimmed sections still rendering must finish before assemble_final shuts the
+        # browser down (or they would relaunch it); then drop their clips and temp files.
+        for future in dropped_renders:
+            _discard_scene(future)
+        
+        if not scenes:
+            print("❌ No scenes created.")
+            raise Exception("No scenes created.")
 
-    # Final Assembly
-    print(f"\n🎞️ Assembling Final Master: {title_suffix}")
-    output_filename = f"outputs/{sign.split()[0]}_{title_suffix}.mp4"
-    os.makedirs("outputs", exist_ok=True)
+        # Final Assembly
+        print(f"\n🎞️ Assembling Final Master: {title_suffix}")
+        output_filename = f"outputs/{sign_file}_{title_suffix}.mp4"
     
-    editor.assemble_final(scenes, output_filename, mood=content_mood, sign_name=sign)
-    print(f"\n✅ CREATED: {output_filename}")
+        editor.assemble_final(scenes, output_filename, mood=content_mood, sign_name=sign)
+        if not os.path.exists(output_filename):
+            raise Exception(f"Final video was not written: {output_filename}")
+        print(f"\n✅ CREATED: {output_filename}")
+    finally:
+        for audio_clip in audio_clips:
+            try:
+                audio_clip.close()
+            except Exception:
+                pass
+    
+    return output_filename
 
 
 def main():
@@ -331,23 +534,21 @@ def main():
     parser.add_argument("--rashi", type=str, default=None, help="(Deprecated) Use --sign instead")
     parser.add_argument("--type", type=str, default="shorts", choices=["shorts", "detailed"], help="Video Type: shorts (Morning) or detailed (Evening)")
     parser.add_argument("--upload", action="store_true", help="Upload to YouTube after generation")
+    parser.add_argument("--no-meta", action="store_true", help="Skip LLM viral metadata; upload with simple metadata")
     args = parser.parse_args()
     
+    # Working directories, created once per run
+    os.makedirs("outputs", exist_ok=True)
+    os.makedirs("assets/temp", exist_ok=True)
+    
     # Handle backward compatibility
     target_sign = args.rashi if args.rashi else args.sign
     
-    # Initialize Agents
-    agents = {
-        'astrologer': AstrologerAgent(),
-        'director': DirectorAgent(),
-        'narrator': NarratorAgent(),
-        'editor': EditorEngine(),
-        'uploader': YouTubeUploader()
-    }
+    # Initialize Agents (lazily: e.g. the uploader is only built on --upload runs)
+    agents = LazyAgents()
     
     # Use US Eastern timezone for American audience
-    est = pytz.timezone('America/New_York')
-    today = datetime.now(est)
+    today = datetime.now(_EST)
     date_str = today.strftime("%B %d, %Y")  # e.g., "January 26, 2026"
     month_year = today.strftime("%B %Y")
     year_str = today.strftime("%Y")
@@ -385,7 +586,7 @@ def main():
             daily_header = f"Daily Horoscope: {date_str}"
             
             suffix = f"Daily_{today.strftime('%Y%m%d')}"
-            produce_video_from_script(
+            video_path = produce_video_from_script(
                 agents, 
                 target_sign, 
                 suffix, 
@@ -400,9 +601,7 @@ def main():
             
             # IMMEDIATE UPLOAD
             if args.upload:
-                sign_clean = target_sign.split()[0]
-                path = f"outputs/{sign_clean}_{suffix}.mp4"
-                process_immediate_upload(agents, path, daily_script, target_sign, date_str, "Daily")
+                asyncio.run(process_immediate_upload(agents, video_path, daily_script, target_sign, date_str, "Daily", skip_meta=args.no_meta))
             
 
         except Exception as e:
@@ -415,84 +614,52 @@ def main():
     # MODE 2: DETAILED (EVENING)
     # ==========================
     elif args.type == "detailed":
-        detailed_produced = False
+        astrologer = agents['astrologer']
         
+        # Resolve the candidates from the date up front (cheap), in priority order:
+        # (banner, generator, label, suffix, period_type, header, fail message).
+        # Each entry runs only if the one before it failed; Insight is the last resort.
+        attempts = []
         # CHECK 1: YEARLY (Priority 1) - On Jan 1-12 based on sign index
         if today.month == 1 and today.day == sign_idx:
-            try:
-                print(f"\n🎆 HAPPY NEW YEAR! It is Jan {today.day}! Generating YEARLY Horoscope for {target_sign}...")
-                yearly_script = agents['astrologer'].generate_yearly_forecast(target_sign, year_str)
-                yearly_header = f"Yearly Horoscope: {year_str}"
-                
-                suffix = f"Yearly_{year_str}"
-                produce_video_from_script(
-                    agents, target_sign, suffix, yearly_script, year_str,
-                    period_type="Yearly", header_text=yearly_header
-                )
-                
-
-                
-                if args.upload:
-                    sign_clean = target_sign.split()[0]
-                    path = f"outputs/{sign_clean}_{suffix}.mp4"
-                    process_immediate_upload(agents, path, yearly_script, target_sign, year_str, "Yearly")
-
-                detailed_produced = True
-                
-            except Exception as e:
-                print(f"❌ Yearly Video Failed: {e}")
-
-        # CHECK 2: MONTHLY (Priority 2, only if not Yearly)
-        if not detailed_produced and today.day == sign_idx: 
-            try:
-                print(f"\n📅 It is Day {today.day}! Generating MONTHLY Horoscope for {target_sign}...")
-                monthly_script = agents['astrologer'].generate_monthly_forecast(target_sign, month_year)
-                monthly_header = f"Monthly Horoscope: {month_year}"
-                
-                suffix = f"Monthly_{today.strftime('%B_%Y')}"
-                produce_video_from_script(
-                    agents, target_sign, suffix, monthly_script, month_year,
-                    period_type="Monthly", header_text=monthly_header
-                )
-                
-
-                
-                if args.upload:
-                    sign_clean = target_sign.split()[0]
-                    path = f"outputs/{sign_clean}_{suffix}.mp4"
-                    process_immediate_upload(agents, path, monthly_script, target_sign, month_year, "Monthly")
-
-                detailed_produced = True
-                
-            except Exception as e:
-                print(f"❌ Monthly Video Failed: {e}")
-
+            attempts.append((
+                f"\n🎆 HAPPY NEW YEAR! It is Jan {today.day}! Generating YEARLY Horoscope for {target_sign}...",
+                astrologer.generate_yearly_forecast, year_str, f"Yearly_{year_str}",
+                "Yearly", f"Yearly Horoscope: {year_str}", "❌ Yearly Video Failed"
+            ))
+        # CHECK 2: MONTHLY (Priority 2)
+        if today.day == sign_idx:
+            attempts.append((
+                f"\n📅 It is Day {today.day}! Generating MONTHLY Horoscope for {target_sign}...",
+                astrologer.generate_monthly_forecast, month_year, f"Monthly_{today.strftime('%B_%Y')}",
+                "Monthly", f"Monthly Horoscope: {month_year}", "❌ Monthly Video Failed"
+            ))
         # CHECK 3: DAILY INSIGHT (Priority 3, Fallback)
-        if not detailed_produced:
+        attempts.append((
+            f"\n✨ Generating DAILY COSMIC INSIGHT (Evening Special)...",
+            astrologer.generate_daily_insight_script, date_str, f"Insight_{today.strftime('%Y%m%d')}",
+            "Daily_Insight", f"Cosmic Insight: {date_str}", "❌ Insight Video Failed"
+        ))
+        
+        for i, (banner, generate, label, suffix, period, header, fail_msg) in enumerate(attempts):
             try:
-                print(f"\n✨ Generating DAILY COSMIC INSIGHT (Evening Special)...")
-                insight_script = agents['astrologer'].generate_daily_insight_script(target_sign, date_str)
-                insight_header = f"Cosmic Insight: {date_str}"
-                
-                suffix = f"Insight_{today.strftime('%Y%m%d')}"
-                produce_video_from_script(
-                    agents, target_sign, suffix, insight_script, date_str,
-                    period_type="Daily_Insight", header_text=insight_header
+                print(banner)
+                script = generate(target_sign, label)
+                video_path = produce_video_from_script(
+                    agents, target_sign, suffix, script, label,
+                    period_type=period, header_text=header
                 )
                 
-
-                
                 if args.upload:
-                    sign_clean = target_sign.split()[0]
-                    path = f"outputs/{sign_clean}_{suffix}.mp4"
-                    process_immediate_upload(agents, path, insight_script, target_sign, date_str, "Daily_Insight")
-
+                    asyncio.run(process_immediate_upload(agents, video_path, script, target_sign, label, period, skip_meta=args.no_meta))
+                break
                 
             except Exception as e:
-                print(f"❌ Insight Video Failed: {e}")
-                import traceback
-                traceback.print_exc()
-                sys.exit(1)
+                print(f"{fail_msg}: {e}")
+                if i == len(attempts) - 1:
+                    import traceback
+                    traceback.print_exc()
+                    sys.exit(1)
 
     # Removed old bulk upload loop
 